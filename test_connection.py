@@ -9,7 +9,7 @@ import requests
 import time
 import subprocess
 import webbrowser
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the parent directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -28,17 +28,25 @@ def check_server_status(url="http://localhost:8000"):
         print(f"❌ Could not connect to FastAPI server at {url}")
         return False
 
+def _poll_until_ready(url="http://localhost:8000", timeout=10):
+    """Poll the FastAPI server once per second until it responds or the timeout expires."""
+    for _ in range(timeout):
+        time.sleep(1)
+        if check_server_status(url):
+            return True
+    return False
+
 def check_frontend_build():
     """Check if the frontend build exists."""
-    ui_dist_path = Path("ui/dist")
-    if ui_dist_path.exists() and ui_dist_path.is_dir():
-        index_html = ui_dist_path / "index.html"
-        if index_html.exists():
-            print("✅ Frontend build exists")
-            return True
+    try:
+        with open("ui/dist/index.html", "rb"):
+            pass
+    except OSError:
+        print("❌ Frontend build not found")
+        return False
 
-    print("❌ Frontend build not found")
-    return False
+    print("✅ Frontend build exists")
+    return True
 
 def main():
     """Main function to test the connection."""
@@ -56,20 +64,18 @@ def main():
             text=True
         )
 
-        # Wait for server to start
-        for _ in range(10):
-            time.sleep(1)
-            if check_server_status():
-                server_running = True
-                break
+    # Check frontend build while the server starts up
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        fut_frontend = executor.submit(check_frontend_build)
+        if not server_running:
+            fut_server = executor.submit(_poll_until_ready, timeout=10)
+            server_running = fut_server.result()
+        frontend_built = fut_frontend.result()
 
     if not server_running:
         print("❌ Failed to start FastAPI server")
         return
 
-    # Check frontend build
-    frontend_built = check_frontend_build()
-
     if not frontend_built:
         print("\nBuilding frontend...")
         os.chdir("ui")
@@ -0,0 +1,85 @@
+"""
+Tests for the CLI tool.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+import pytest
+
+from autobot.tools.cli import CLITool
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses bash scripts")
+
+@pytest.fixture
+def tool(tmp_path, monkeypatch):
+    script_dir = tmp_path / "scripts"
+    monkeypatch.setattr(CLITool, "SCRIPT_DIR", str(script_dir))
+    monkeypatch.setattr(CLITool, "_script_cache", OrderedDict())
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    return CLITool(working_dir=str(work_dir))
+
+def test_execute_script_runs_in_working_dir(tool):
+    result = tool.execute_script("pwd")
+    
+    assert result["status"] == "success", result
+    assert result["stdout"] == f"{os.path.realpath(tool.working_dir)}\n"
+    assert os.listdir(tool.working_dir) == []
+
+def test_execute_script_reuses_unchanged_script(tool):
+    first = tool.execute_script("echo hello")
+    script_files = os.listdir(CLITool.SCRIPT_DIR)
+    inode = os.stat(os.path.join(CLITool.SCRIPT_DIR, script_files[0])).st_ino
+    
+    second = tool.execute_script("echo hello")
+    
+    assert first["stdout"] == second["stdout"] == "hello\n"
+    assert os.listdir(CLITool.SCRIPT_DIR) == script_files
+    assert os.stat(os.path.join(CLITool.SCRIPT_DIR, script_files[0])).st_ino == inode
+
+def test_execute_script_writes_changed_script(tool):
+    tool.execute_script("echo one")
+    result = tool.execute_script("echo two")
+    
+    assert result["stdout"] == "two\n"
+    assert len(os.listdir(CLITool.SCRIPT_DIR)) == 2
+
+def test_execute_script_evicts_least_recently_used(tool, monkeypatch):
+    monkeypatch.setattr(CLITool, "SCRIPT_CACHE_SIZE", 2)
+    
+    for word in ("one", "two", "one", "three"):
+        tool.execute_script(f"echo {word}")
+    
+    assert sorted(CLITool._script_cache) == sorted(
+        os.path.join(CLITool.SCRIPT_DIR, name) for name in os.listdir(CLITool.SCRIPT_DIR)
+    )
+    assert len(CLITool._script_cache) == 2
+    assert tool.execute_script("echo one")["stdout"] == "one\n"
+
+def test_execute_script_replaces_script_not_private_to_user(tool):
+    tool.execute_script("echo mine")
+    script_path = os.path.join(CLITool.SCRIPT_DIR, os.listdir(CLITool.SCRIPT_DIR)[0])
+    with open(script_path, "w") as f:
+        f.write("#!/bin/bash\necho planted\n")
+    os.chmod(script_path, 0o777)
+    
+    result = tool.execute_script("echo mine")
+    
+    assert result["stdout"] == "mine\n"
+
+@pytest.mark.parametrize("make_dir", [
+    lambda path, target: os.symlink(target, path),
+    lambda path, target: (os.mkdir(path), os.chmod(path, 0o777)),
+])
+def test_execute_script_refuses_unsafe_script_dir(tool, tmp_path, make_dir):
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    make_dir(CLITool.SCRIPT_DIR, str(target))
+    
+    result = tool.execute_script("echo hello")
+    
+    assert result["status"] == "error"
+    assert "Refusing to use script directory" in result["error"]
+    assert os.listdir(target) == []
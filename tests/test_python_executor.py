@@ -0,0 +1,218 @@
+"""
+Tests for the Python executor tool.
+"""
+
+import os
+import sys
+import ast
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from autobot.tools import python as python_tool
+from autobot.tools.python import PythonExecutorTool, _jit_float_args
+
+def _float_args(source):
+    return _jit_float_args(ast.parse(source).body[0])
+
+@pytest.mark.parametrize("source", [
+    # Integer accumulators wrap around at 64 bits under Numba
+    "def fact(n):\n    r = 1\n    for i in range(1, n + 1):\n        r *= i\n    return r",
+    "def power_sum(n):\n    s = 0\n    for i in range(n):\n        s += i ** 3\n    return s",
+    "def inner(n):\n    s = 0.0\n    for i in range(n):\n        s += i * i * i * i\n    return s",
+    "def fib(n):\n    a = 0\n    b = 1\n    for i in range(n):\n        a = b\n        b = a + b\n    return a",
+    # Globals could change between calls
+    "def uses_global(n):\n    s = 0.0\n    for i in range(n):\n        s += scale\n    return s",
+    # Python raises (or returns a complex) where Numba returns nan or inf
+    "def roots(n):\n    s = 0.0\n    for i in range(n):\n        s += math.sqrt(i - 5.0)\n    return s",
+    "def logs(n):\n    s = 0.0\n    for i in range(n):\n        s += math.log(i * 1.0)\n    return s",
+    "def exps(n):\n    s = 0.0\n    for i in range(n):\n        s += math.exp(i * 100.0)\n    return s",
+    "def powers(n):\n    s = 0.0\n    for i in range(n):\n        s += (i - 5.0) ** 0.5\n    return s",
+    "def to_int(a, n):\n    s = 0\n    for i in range(n):\n        s = s % 7 + int(a[i])\n    return s",
+])
+def test_jit_rejects_unsafe_functions(source):
+    assert _float_args(source) is None
+
+def test_jit_accepts_float_loop():
+    source = "def f(n):\n    s = 0.0\n    for i in range(n):\n        s += math.fabs(i - math.pi) * 2\n    return s"
+    assert _float_args(source) == ()
+
+def test_jit_requires_float_arguments_used_in_arithmetic():
+    source = (
+        "def dot(a, b, n):\n"
+        "    s = 0.0\n"
+        "    for i in range(n - 1):\n"
+        "        if i % 2 == 0:\n"
+        "            s += a[i + 1] * b[i]\n"
+        "    return s"
+    )
+    assert _float_args(source) == ("a", "b")
+
+def test_jit_function_uses_the_callers_globals():
+    pytest.importorskip("numba")
+    source = "def f(n):\n    s = 0.0\n    for i in range(n):\n        s += math.fabs(i - 0.5)\n    return s"
+    
+    def define(math_module):
+        namespace = {"math": math_module}
+        exec(source, namespace)
+        return python_tool._jit(source, False, ())(namespace["f"])
+    
+    compiled = define(math)
+    compiled(10)
+    # The single compiler thread has finished once a later job runs
+    python_tool._jit_executor.submit(lambda: None).result()
+    assert compiled(10) == 41.0
+    
+    class ShadowMath:
+        @staticmethod
+        def fabs(x):
+            return 1.0
+    
+    shadowed = define(ShadowMath)
+    assert shadowed.compilation is compiled.compilation
+    assert shadowed(10) == 10.0
+
+def test_in_process_captures_output():
+    tool = PythonExecutorTool()
+    
+    result = tool.execute({"code": "import sys\nprint('out')\nprint('err', file=sys.stderr)"})
+    
+    assert result == {"status": "success", "output": "out\n", "stderr": "err\n"}
+
+def test_in_process_captures_output_of_snippet_threads():
+    code = (
+        "import threading\n"
+        "print('main')\n"
+        "t = threading.Thread(target=print, args=('from thread',))\n"
+        "t.start()\n"
+        "t.join()\n"
+    )
+    
+    result = PythonExecutorTool().execute({"code": code})
+    
+    assert result["output"] == "main\nfrom thread\n"
+
+def test_in_process_capture_ignores_threads_not_started_by_snippet():
+    tool = PythonExecutorTool()
+    tool.execute({"code": "pass"})
+    
+    stop = threading.Event()
+    
+    def chatter():
+        while not stop.is_set():
+            print("outside")
+            sys.stdout.writelines(["outside\n"])
+            time.sleep(0.005)
+    
+    thread = threading.Thread(target=chatter)
+    thread.start()
+    try:
+        result = tool.execute({"code": "import sys, time\ntime.sleep(0.1)\nsys.stdout.writelines(['in', 'side\\n'])"})
+    finally:
+        stop.set()
+        thread.join()
+    
+    assert result["output"] == "inside\n"
+
+def test_concurrent_in_process_runs_keep_their_own_output():
+    code = "import time\nfor i in range(5):\n    print(N)\n    time.sleep(0.01)\n"
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda n: PythonExecutorTool().execute({"code": code.replace("N", str(n))}),
+            range(4)
+        ))
+    
+    for n, result in enumerate(results):
+        assert result["output"] == f"{n}\n" * 5
+
+def test_in_process_reports_exceptions():
+    result = PythonExecutorTool().execute({"code": "1 / 0"})
+    
+    assert result["status"] == "error"
+    assert "ZeroDivisionError" in result["traceback"]
+
+def test_worker_runs_code_with_filename_argv():
+    result = PythonExecutorTool().execute({
+        "code": "import sys\nprint(sys.argv)\nprint('err', file=sys.stderr)",
+        "use_subprocess": True
+    })
+    
+    assert result["status"] == "success"
+    assert result["exit_code"] == 0
+    assert result["stdout"] == "['<autobot>']\n"
+    assert result["stderr"] == "err\n"
+
+def test_saved_script_parses_its_own_arguments(tmp_path):
+    code = "import argparse\nargs = argparse.ArgumentParser().parse_args()\nprint('parsed')"
+    
+    result = PythonExecutorTool(working_dir=str(tmp_path)).execute({
+        "code": code,
+        "save_to_file": True,
+        "filename": "script.py",
+        "use_subprocess": True
+    })
+    
+    assert result["status"] == "success", result
+    assert result["stdout"] == "parsed\n"
+
+def test_worker_runs_in_working_dir(tmp_path):
+    result = PythonExecutorTool().execute({
+        "code": "import os\nprint(os.getcwd())",
+        "use_subprocess": True,
+        "working_dir": str(tmp_path)
+    })
+    
+    assert result["stdout"] == f"{os.path.realpath(tmp_path)}\n"
+
+def test_in_process_run_with_other_working_dir_uses_worker(tmp_path):
+    cwd = os.getcwd()
+    
+    result = PythonExecutorTool(working_dir=str(tmp_path)).execute({"code": "import os\nprint(os.getcwd())"})
+    
+    assert result == {"status": "success", "output": f"{os.path.realpath(tmp_path)}\n"}
+    assert os.getcwd() == cwd
+
+def test_worker_reports_exit_codes():
+    tool = PythonExecutorTool()
+    
+    failed = tool.execute({"code": "import sys\nsys.exit(3)", "use_subprocess": True})
+    raised = tool.execute({"code": "1 / 0", "use_subprocess": True})
+    
+    assert failed["status"] == "error"
+    assert failed["exit_code"] == 3
+    assert raised["exit_code"] == 1
+    assert raised["stderr"].startswith("Traceback (most recent call last):\n  File \"<autobot>\"")
+
+def test_worker_timeout_kills_and_replaces_worker():
+    tool = PythonExecutorTool()
+    
+    result = tool.execute({"code": "while True:\n    pass", "use_subprocess": True, "timeout": 1})
+    
+    assert result == {"status": "error", "error": "Execution timed out after 1 seconds"}
+    
+    after = tool.execute({"code": "print('alive')", "use_subprocess": True})
+    assert after["stdout"] == "alive\n"
+
+def test_worker_runs_do_not_share_state(tmp_path):
+    for name, value in (("a", "A"), ("b", "B")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "helper.py").write_text(f"X = {value!r}\n")
+    tool = PythonExecutorTool()
+    
+    first = tool.execute({
+        "code": "import os, helper\nos.environ['AUTOBOT_LEAK'] = '1'\nprint(helper.X)",
+        "use_subprocess": True,
+        "working_dir": str(tmp_path / "a")
+    })
+    second = tool.execute({
+        "code": "import os, helper\nprint(helper.X, os.environ.get('AUTOBOT_LEAK'))",
+        "use_subprocess": True,
+        "working_dir": str(tmp_path / "b")
+    })
+    
+    assert first["stdout"] == "A\n"
+    assert second["stdout"] == "B None\n"
@@ -0,0 +1,236 @@
+"""
+Tests for the web search tool.
+"""
+
+import threading
+import http.server
+
+import pytest
+
+pytest.importorskip("requests")
+
+from autobot.tools import web_search
+from autobot.tools.web_search import WebSearchTool
+
+class StubResponse:
+    """Minimal streamed response."""
+    
+    def __init__(self, status_code=200, headers=None, body=b""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+        self.encoding = "utf-8"
+        self.closed = False
+    
+    @property
+    def is_redirect(self):
+        return "Location" in self.headers and self.status_code in (301, 302, 303, 307, 308)
+    
+    def raise_for_status(self):
+        pass
+    
+    @property
+    def content(self):
+        return self.body
+    
+    def iter_content(self, chunk_size=1):
+        yield self.body
+    
+    def close(self):
+        self.closed = True
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class StubSession:
+    """Session returning canned responses by URL and recording requests."""
+    
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+    
+    def get(self, url, **kwargs):
+        assert kwargs.get("allow_redirects") is False
+        self.requested.append(url)
+        return self.responses[url]
+
+@pytest.fixture
+def tool(monkeypatch):
+    # Resolve without DNS: only loopback and link-local names are non-public
+    monkeypatch.setattr(
+        web_search, "_is_public_host",
+        lambda host: host not in ("127.0.0.1", "localhost", "169.254.169.254")
+    )
+    return WebSearchTool(api_key="", search_engine_id="")
+
+def test_fetch_rejects_private_host_without_connecting(tool):
+    tool._session = StubSession({})
+    
+    result = tool.execute({"operation": "fetch", "url": "http://127.0.0.1/admin"})
+    
+    assert result["status"] == "error"
+    assert "non-public" in result["error"]
+    assert tool._session.requested == []
+
+def test_fetch_rejects_redirect_to_loopback(tool):
+    redirect = StubResponse(302, {"Location": "http://127.0.0.1/admin"})
+    tool._session = StubSession({"http://public.example/": redirect})
+    
+    result = tool.execute({"operation": "fetch", "url": "http://public.example/"})
+    
+    assert result["status"] == "error"
+    assert "non-public" in result["error"]
+    assert tool._session.requested == ["http://public.example/"]
+    assert redirect.closed
+
+def test_fetch_follows_redirect_to_public_host(tool):
+    page = StubResponse(200, {"Content-Type": "text/html; charset=utf-8"}, b"<title>Hi</title><p>Body</p>")
+    tool._session = StubSession({
+        "http://public.example/": StubResponse(301, {"Location": "/home"}),
+        "http://public.example/home": page
+    })
+    
+    result = tool.execute({"operation": "fetch", "url": "http://public.example/"})
+    
+    assert result["status"] == "success"
+    assert result["title"] == "Hi"
+    assert "Body" in result["text_content"]
+
+def test_fetch_stops_after_too_many_redirects(tool):
+    tool._session = StubSession({
+        "http://public.example/": StubResponse(302, {"Location": "http://public.example/"})
+    })
+    
+    result = tool.execute({"operation": "fetch", "url": "http://public.example/"})
+    
+    assert result["status"] == "error"
+    assert len(tool._session.requested) == web_search.MAX_REDIRECTS + 1
+
+def test_blocked_domain_covers_subdomains(tool):
+    tool.blocked_domains = frozenset(["example"])
+    tool._session = StubSession({})
+    
+    result = tool.execute({"operation": "fetch", "url": "http://www.public.example/"})
+    
+    assert result["status"] == "error"
+    assert "Blocked host" in result["error"]
+
+@pytest.fixture(params=["selectolax", "lxml", "html.parser"])
+def parser_backend(request, monkeypatch):
+    if request.param == "selectolax" and not web_search.SELECTOLAX_AVAILABLE:
+        pytest.skip("selectolax not installed")
+    if request.param == "lxml" and not web_search.LXML_AVAILABLE:
+        pytest.skip("lxml not installed")
+    
+    monkeypatch.setattr(web_search, "SELECTOLAX_AVAILABLE", request.param == "selectolax")
+    monkeypatch.setattr(web_search, "LXML_AVAILABLE", request.param == "lxml")
+
+def test_parse_html_uses_header_charset(parser_backend):
+    content = "<html><head><title>Привет</title></head><body><p>Мир</p></body></html>".encode("cp1251")
+    
+    title, text = web_search._parse_html(content, True, "cp1251")
+    
+    assert title == "Привет"
+    assert "Мир" in text
+
+def test_parse_html_uses_meta_charset(parser_backend):
+    content = '<html><head><meta charset="utf-8"><title>Café</title></head><body><p>Crème</p></body></html>'.encode()
+    
+    title, text = web_search._parse_html(content, True)
+    
+    assert title == "Café"
+    assert "Crème" in text
+
+def test_parse_html_strips_hidden_elements(parser_backend):
+    content = b"<html><body><p>Shown</p><script>var hidden = 1;</script><style>p {}</style><p>Also  shown</p></body></html>"
+    
+    title, text = web_search._parse_html(content, True, "utf-8")
+    
+    assert title == ""
+    assert text == "Shown\nAlso  shown"
+
+class SearchSession:
+    """Session failing Google API requests and answering DuckDuckGo ones."""
+    
+    def __init__(self, google_body=None):
+        self.google_body = google_body
+        self.requested = []
+    
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        if url == web_search.GOOGLE_SEARCH_URL:
+            if self.google_body is not None:
+                return StubResponse(body=self.google_body)
+            raise web_search.requests.exceptions.ConnectionError("unreachable")
+        return StubResponse(body=b'{"Results": [{"Text": "Result", "FirstURL": "http://public.example/"}]}')
+
+def test_fallback_result_is_not_cached_as_google_result(tool):
+    tool.google_search_available = True
+    tool._session = SearchSession()
+    
+    first = tool.execute({"operation": "search", "query": "q"})
+    second = tool.execute({"operation": "search", "query": "q"})
+    
+    assert first["results"][0]["source"] == second["results"][0]["source"] == "DuckDuckGo"
+    assert tool._session.requested.count(web_search.GOOGLE_SEARCH_URL) == 2
+
+def test_invalid_google_response_falls_back(tool):
+    tool.google_search_available = True
+    tool._session = SearchSession(google_body=b"<html>Service Unavailable</html>")
+    
+    result = tool.execute({"operation": "search", "query": "q"})
+    
+    assert result["status"] == "success"
+    assert result["results"][0]["source"] == "DuckDuckGo"
+
+def test_cached_search_results_cannot_be_modified_by_callers(tool):
+    tool._session = SearchSession()
+    
+    first = tool.execute({"operation": "search", "query": "q"})
+    first["results"][0]["title"] = "changed"
+    first["results"].clear()
+    second = tool.execute({"operation": "search", "query": "q"})
+    
+    assert second["results"][0]["title"] == "Result"
+    assert len(tool._session.requested) == 1
+
+@pytest.fixture
+def local_server():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = b"<title>Internal</title>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://localhost:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+def test_fetch_checks_the_address_actually_connected_to(monkeypatch, local_server):
+    # A rebinding name passes the resolution check, then connects to loopback
+    monkeypatch.setattr(web_search, "_is_public_host", lambda host: True)
+    tool = WebSearchTool(api_key="", search_engine_id="")
+    
+    result = tool.execute({"operation": "fetch", "url": local_server})
+    
+    assert result["status"] == "error"
+    assert "non-public address" in result["error"]
+
+def test_fetch_connects_to_private_address_when_allowed(local_server):
+    tool = WebSearchTool(api_key="", search_engine_id="", allow_private_hosts=True)
+    
+    result = tool.execute({"operation": "fetch", "url": local_server})
+    
+    assert result["status"] == "success"
+    assert result["title"] == "Internal"
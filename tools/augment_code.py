@@ -5,10 +5,15 @@ Interfaces with the Augment Code VS Code extension.
 """
 
 import os
+import re
+import sys
 import json
 import logging
 import time
+import shutil
+import socket
 import subprocess
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 
 from autobot.tools.base import Tool
@@ -16,6 +21,62 @@ from autobot.tools.base import Tool
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Augment Code extension ID
+# Note: This is a placeholder, replace with actual extension ID
+AUGMENT_CODE_EXTENSION_ID = "augmentcode.augmentcode"
+
+# Compact JSON encoder for VS Code command arguments
+_dumps = json.JSONEncoder(
+    separators=(",", ":"),
+    check_circular=False,
+    ensure_ascii=False
+).encode
+
+# Platform detection, evaluated once at import
+_IS_MAC = os.name == "posix" and sys.platform == "darwin"
+_IS_LINUX = os.name == "posix" and not _IS_MAC
+
+# Common paths for VS Code
+_VSCODE_PATHS_BY_PLATFORM = {
+    "win32": [
+        os.path.expandvars(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
+        os.path.expandvars(r"%ProgramFiles%\Microsoft VS Code\Code.exe"),
+        os.path.expandvars(r"%ProgramFiles(x86)%\Microsoft VS Code\Code.exe")
+    ],
+    "darwin": [
+        "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code",
+        os.path.expanduser("~/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code")
+    ],
+    "linux": [
+        "/usr/bin/code",
+        "/usr/local/bin/code",
+        os.path.expanduser("~/.local/bin/code")
+    ]
+}
+
+# Other POSIX systems (e.g. BSDs) use the Linux locations
+_VSCODE_PATHS = _VSCODE_PATHS_BY_PLATFORM.get(
+    sys.platform,
+    _VSCODE_PATHS_BY_PLATFORM["linux"] if _IS_LINUX else []
+)
+
+def _find_extensions(listing: str, extension_ids: List[str]) -> frozenset:
+    """
+    Find which of the given extension IDs appear in `code --list-extensions` output.
+    
+    Args:
+        listing (str): Raw output of `code --list-extensions`, one ID per line
+        extension_ids (List[str]): Extension IDs to look for
+        
+    Returns:
+        frozenset: Extension IDs that are installed
+    """
+    pattern = re.compile(
+        "^(?:" + "|".join(map(re.escape, extension_ids)) + r")\r?$",
+        re.MULTILINE
+    )
+    return frozenset(match.rstrip("\r") for match in pattern.findall(listing))
+
 class AugmentCodeTool(Tool):
     """Tool for interfacing with Augment Code VS Code extension."""
     
@@ -34,19 +95,35 @@ class AugmentCodeTool(Tool):
         # Find VS Code executable
         self.vscode_path = vscode_path or self._find_vscode()
         
+        # IPC socket of a running VS Code window (set in its integrated terminal)
+        self._vscode_ipc_hook = os.environ.get("VSCODE_IPC_HOOK_CLI")
+        
         # Check if VS Code is available
         self.vscode_available = bool(self.vscode_path)
         
-        # Check if Augment Code extension is installed
-        self.augment_code_available = self._check_augment_code()
+        # Start the extension listing in the background; it is collected on first use
+        self._extension_probe = self._start_extension_probe()
+        self._augment_code_available = None
         
-        if self.vscode_available and self.augment_code_available:
+        if self.vscode_available:
             logger.info("Augment Code Tool initialized successfully")
         else:
-            if not self.vscode_available:
-                logger.error("VS Code not found. Please provide the path to VS Code executable.")
-            if not self.augment_code_available:
+            logger.error("VS Code not found. Please provide the path to VS Code executable.")
+    
+    @property
+    def augment_code_available(self) -> bool:
+        """
+        Whether the Augment Code extension is installed.
+        
+        Returns:
+            bool: Whether Augment Code is available
+        """
+        if self._augment_code_available is None:
+            self._augment_code_available = self._check_augment_code()
+            if not self._augment_code_available:
                 logger.error("Augment Code extension not found. Please install it in VS Code.")
+        
+        return self._augment_code_available
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -129,76 +206,64 @@ class AugmentCodeTool(Tool):
         Returns:
             Optional[str]: Path to VS Code executable
         """
-        # Common paths for VS Code
-        common_paths = []
-        
-        # Windows
-        if os.name == "nt":
-            common_paths.extend([
-                os.path.expandvars(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
-                os.path.expandvars(r"%ProgramFiles%\Microsoft VS Code\Code.exe"),
-                os.path.expandvars(r"%ProgramFiles(x86)%\Microsoft VS Code\Code.exe")
-            ])
-        # macOS
-        elif os.name == "posix" and os.uname().sysname == "Darwin":
-            common_paths.extend([
-                "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code",
-                os.path.expanduser("~/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code")
-            ])
-        # Linux
-        elif os.name == "posix":
-            common_paths.extend([
-                "/usr/bin/code",
-                "/usr/local/bin/code",
-                os.path.expanduser("~/.local/bin/code")
-            ])
-        
-        # Check if VS Code is in PATH
-        try:
-            if os.name == "nt":
-                result = subprocess.run(["where", "code"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    return result.stdout.strip().split("\n")[0]
-            else:
-                result = subprocess.run(["which", "code"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    return result.stdout.strip()
-        except:
-            pass
+        # Check if VS Code is in PATH (in-process scan, honours PATHEXT on Windows)
+        path = shutil.which("code")
+        if path:
+            return path
         
         # Check common paths
-        for path in common_paths:
-            if os.path.exists(path):
+        for path in _VSCODE_PATHS:
+            try:
+                os.stat(path)
                 return path
+            except OSError:
+                continue
         
         return None
     
-    def _check_augment_code(self) -> bool:
+    def _start_extension_probe(self) -> Optional[subprocess.Popen]:
         """
-        Check if Augment Code extension is installed.
+        Start listing installed VS Code extensions without waiting for the result.
         
         Returns:
-            bool: Whether Augment Code is available
+            Optional[subprocess.Popen]: Running probe process, or None if it could not start
         """
         if not self.vscode_available:
-            return False
+            return None
         
         try:
-            # List installed extensions
-            result = subprocess.run(
+            return subprocess.Popen(
                 [self.vscode_path, "--list-extensions"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True
             )
+        except Exception as e:
+            logger.warning(f"Failed to list VS Code extensions: {str(e)}")
+            return None
+    
+    def _check_augment_code(self) -> bool:
+        """
+        Check if Augment Code extension is installed.
+        
+        Returns:
+            bool: Whether Augment Code is available
+        """
+        probe = self._extension_probe
+        self._extension_probe = None
+        
+        if probe is None:
+            return False
+        
+        try:
+            # Collect the installed extensions listing
+            stdout, _ = probe.communicate()
             
-            if result.returncode == 0:
-                extensions = result.stdout.strip().split("\n")
-                
+            if probe.returncode == 0:
                 # Check for Augment Code extension
-                # Note: This is a placeholder, replace with actual extension ID
-                augment_code_id = "augmentcode.augmentcode"
+                installed = _find_extensions(stdout, [AUGMENT_CODE_EXTENSION_ID])
                 
-                return augment_code_id in extensions
+                return AUGMENT_CODE_EXTENSION_ID in installed
             
             return False
         except:
@@ -227,6 +292,16 @@ class AugmentCodeTool(Tool):
                 "error": "No file path provided"
             }
         
+        # Prefer the running VS Code instance over spawning a new CLI process
+        if self._send_open_request(file_path, line, column):
+            return {
+                "status": "success",
+                "message": f"Opened file: {file_path}",
+                "file_path": file_path,
+                "line": line,
+                "column": column
+            }
+        
         # Construct command
         command = [self.vscode_path, file_path]
         
@@ -254,6 +329,53 @@ class AugmentCodeTool(Tool):
                 "error": f"Failed to open file: {str(e)}"
             }
     
+    def _send_open_request(self, file_path: str, line: Optional[int] = None, column: Optional[int] = None) -> bool:
+        """
+        Ask a running VS Code instance to open a file through its CLI IPC socket.
+        
+        Args:
+            file_path (str): Path to file
+            line (int, optional): Line number to navigate to. Defaults to None.
+            column (int, optional): Column number to navigate to. Defaults to None.
+            
+        Returns:
+            bool: Whether the running instance accepted the request
+        """
+        if not self._vscode_ipc_hook or not hasattr(socket, "AF_UNIX"):
+            return False
+        
+        file_uri = Path(os.path.abspath(file_path)).as_uri()
+        if line is not None:
+            file_uri += f":{line}"
+            if column is not None:
+                file_uri += f":{column}"
+        
+        body = json.dumps({
+            "type": "open",
+            "fileURIs": [file_uri],
+            "gotoLineMode": line is not None,
+            "forceReuseWindow": True
+        }).encode()
+        request = (
+            b"POST / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+            b"Connection: close\r\n\r\n" + body
+        )
+        
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(2)
+                sock.connect(self._vscode_ipc_hook)
+                sock.sendall(request)
+                status_line = sock.recv(64).split(b"\r\n", 1)[0]
+        except OSError as e:
+            logger.debug(f"VS Code IPC socket unavailable, falling back to CLI: {str(e)}")
+            return False
+        
+        return status_line.split(b" ")[1:2] == [b"200"]
+    
     def _ask_question(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Ask a question to Augment Code.
@@ -359,7 +481,7 @@ class AugmentCodeTool(Tool):
             # Add arguments if provided
             if args:
                 # Convert args to JSON string
-                args_json = json.dumps(args)
+                args_json = _dumps(args)
                 vscode_command.extend(["--args", args_json])
             
             # Execute command
@@ -9,6 +9,12 @@ import subprocess
 import logging
 import platform
 import shlex
+import shutil
+import stat
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 
 from autobot.tools.base import Tool
@@ -16,9 +22,50 @@ from autobot.tools.base import Tool
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Characters that require cmd.exe to interpret a Windows command line
+WINDOWS_SHELL_CHARS = frozenset('"^&|<>%()')
+
+# Extensions of scripts that only cmd.exe can run
+WINDOWS_BATCH_EXTENSIONS = (".bat", ".cmd")
+
+# cmd.exe built-ins, which must not resolve to same-named binaries on PATH
+WINDOWS_SHELL_BUILTINS = frozenset([
+    "assoc", "call", "cd", "chdir", "cls", "copy", "date", "del", "dir", "echo",
+    "erase", "exit", "for", "if", "md", "mkdir", "mklink", "move", "path", "popd",
+    "pushd", "rd", "ren", "rename", "rmdir", "set", "start", "time", "title",
+    "type", "ver", "vol"
+])
+
+def _is_private(st: os.stat_result) -> bool:
+    """
+    Check that a file is owned by the current user and closed to everyone else.
+    
+    Args:
+        st (os.stat_result): Result of os.lstat
+        
+    Returns:
+        bool: Whether the file is private; always True where there are no POSIX owners
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
 class CLITool(Tool):
     """Tool for executing shell commands."""
     
+    # Maximum number of script files kept on disk for reuse by execute_script
+    SCRIPT_CACHE_SIZE = 32
+    
+    # Private per-user directory holding script files written by execute_script
+    SCRIPT_DIR = os.path.join(
+        tempfile.gettempdir(),
+        f"autobot-scripts-{os.getuid()}" if hasattr(os, "getuid") else "autobot-scripts"
+    )
+    
+    # Script paths written by execute_script, shared across instances (LRU order)
+    _script_cache: "OrderedDict[str, None]" = OrderedDict()
+    _script_lock = threading.Lock()
+    
     def __init__(self, working_dir: str = None):
         """
         Initialize the CLI tool.
@@ -34,6 +81,9 @@ class CLITool(Tool):
         self.working_dir = working_dir
         self.os_type = platform.system()
         
+        # Resolved executable paths by program name (Windows only)
+        self._binary_cache: Dict[str, Optional[str]] = {}
+        
         logger.info(f"CLI Tool initialized (OS: {self.os_type})")
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -46,12 +96,21 @@ class CLITool(Tool):
                 - timeout (int, optional): Timeout in seconds. Defaults to 60.
                 - working_dir (str, optional): Working directory. Defaults to self.working_dir.
                 - capture_output (bool, optional): Whether to capture output. Defaults to True.
+                - decode (bool, optional): Whether to decode captured output to text. Defaults to True.
+                - stdout_path (str, optional): File to stream stdout into instead of capturing it.
+                  Use this for long builds (e.g. "/tmp/build.log") to avoid buffering and decoding
+                  the full output in memory.
+                - stderr_path (str, optional): File to stream stderr into instead of capturing it.
             
         Returns:
             Dict[str, Any]: Execution result
                 - status (str): "success" or "error"
-                - stdout (str): Standard output (if capture_output is True)
-                - stderr (str): Standard error (if capture_output is True)
+                - stdout (str): Standard output (if captured and decode is True)
+                - stderr (str): Standard error (if captured and decode is True)
+                - stdout_bytes (bytes): Raw standard output (if captured and decode is False)
+                - stderr_bytes (bytes): Raw standard error (if captured and decode is False)
+                - stdout_path (str): File holding standard output (if stdout_path was given)
+                - stderr_path (str): File holding standard error (if stderr_path was given)
                 - exit_code (int): Exit code
                 - command (str): Executed command
                 - error (str): Error message (if status is "error")
@@ -63,6 +122,9 @@ class CLITool(Tool):
         timeout = params.get("timeout", 60)
         working_dir = params.get("working_dir", self.working_dir)
         capture_output = params.get("capture_output", True)
+        decode = params.get("decode", True)
+        stdout_path = params.get("stdout_path")
+        stderr_path = params.get("stderr_path")
         
         if not command:
             result = {
@@ -76,25 +138,55 @@ class CLITool(Tool):
         
         logger.info(f"Executing command: {command}")
         
+        stdout_file = None
+        stderr_file = None
+        
         try:
             # Prepare command based on OS
             if self.os_type == "Windows":
-                # For Windows, use shell=True to support built-in commands
-                shell = True
-                # No need to split the command on Windows with shell=True
-                cmd = command
+                # Run real binaries directly; only shell built-ins and shell syntax need cmd.exe
+                parts = None
+                if not WINDOWS_SHELL_CHARS.intersection(command):
+                    parts = shlex.split(command, posix=False)
+                
+                binary = None
+                if parts and parts[0].lower() not in WINDOWS_SHELL_BUILTINS:
+                    binary = self._resolve_binary(parts[0])
+                
+                if binary:
+                    # Batch files can only be run through cmd.exe
+                    shell = binary.lower().endswith(WINDOWS_BATCH_EXTENSIONS)
+                    cmd = [binary] + parts[1:]
+                else:
+                    # Fall back to shell=True for built-in commands like `dir`
+                    shell = True
+                    cmd = command
             else:
                 # For Unix-like systems, split the command
                 shell = False
                 cmd = shlex.split(command)
             
+            # Stream output to files when requested, otherwise capture through pipes
+            if stdout_path:
+                stdout_file = open(stdout_path, "wb")
+                stdout = stdout_file
+            else:
+                stdout = subprocess.PIPE if capture_output else None
+            
+            if stderr_path:
+                stderr_file = open(stderr_path, "wb")
+                stderr = stderr_file
+            else:
+                stderr = subprocess.PIPE if capture_output else None
+            
             # Execute command
             process = subprocess.run(
                 cmd,
                 shell=shell,
                 cwd=working_dir,
-                capture_output=capture_output,
-                text=True,
+                stdout=stdout,
+                stderr=stderr,
+                text=decode,
                 timeout=timeout
             )
             
@@ -105,14 +197,23 @@ class CLITool(Tool):
                 "command": command
             }
             
-            if capture_output:
-                result["stdout"] = process.stdout
-                result["stderr"] = process.stderr
+            if stdout_path:
+                result["stdout_path"] = stdout_path
+            elif capture_output:
+                result["stdout" if decode else "stdout_bytes"] = process.stdout
+            
+            if stderr_path:
+                result["stderr_path"] = stderr_path
+            elif capture_output:
+                result["stderr" if decode else "stderr_bytes"] = process.stderr
             
             if process.returncode != 0:
                 result["error"] = f"Command failed with exit code {process.returncode}"
-                if capture_output:
-                    result["error"] += f": {process.stderr}"
+                if capture_output and not stderr_path:
+                    stderr_output = process.stderr
+                    if not decode:
+                        stderr_output = stderr_output.decode(errors="replace")
+                    result["error"] += f": {stderr_output}"
             
             self._set_result(result)
             self._set_status("idle")
@@ -137,8 +238,28 @@ class CLITool(Tool):
             self._set_result(result)
             self._set_status("idle")
             return result
+        
+        finally:
+            if stdout_file:
+                stdout_file.close()
+            if stderr_file:
+                stderr_file.close()
+    
+    def _resolve_binary(self, program: str) -> Optional[str]:
+        """
+        Resolve a program name to an executable path, caching the lookup.
+        
+        Args:
+            program (str): Program name or path
+            
+        Returns:
+            Optional[str]: Path to the executable, or None if it is not on PATH
+        """
+        if program not in self._binary_cache:
+            self._binary_cache[program] = shutil.which(program)
+        return self._binary_cache[program]
     
-    def execute_script(self, script: str, script_name: str = "script", timeout: int = 60, working_dir: str = None) -> Dict[str, Any]:
+    def execute_script(self, script: str, script_name: str = "script", timeout: int = 60, working_dir: str = None, stdout_path: str = None) -> Dict[str, Any]:
         """
         Execute a multi-line script by saving it to a temporary file and running it.
         
@@ -147,6 +268,8 @@ class CLITool(Tool):
             script_name (str, optional): Base name for the script file. Defaults to "script".
             timeout (int, optional): Timeout in seconds. Defaults to 60.
             working_dir (str, optional): Working directory. Defaults to self.working_dir.
+            stdout_path (str, optional): File to stream stdout into, recommended for long
+                builds (e.g. "/tmp/build.log"). Defaults to None.
             
         Returns:
             Dict[str, Any]: Execution result
@@ -166,30 +289,41 @@ class CLITool(Tool):
         
         # Determine file extension based on OS
         if self.os_type == "Windows":
-            script_file = f"{script_name}.bat"
+            extension = ".bat"
             script = script.replace("\n", "\r\n")  # Ensure Windows line endings
         else:
-            script_file = f"{script_name}.sh"
+            extension = ".sh"
             script = "#!/bin/bash\n" + script
         
-        script_path = os.path.join(working_dir, script_file)
+        # Name the file after its content so unchanged scripts can be reused
+        script_hash = hashlib.blake2b(script.encode(), digest_size=8).hexdigest()
+        script_path = os.path.join(self.SCRIPT_DIR, f"{script_name}.{script_hash}{extension}")
         
         try:
-            # Write script to file
-            with open(script_path, "w") as f:
-                f.write(script)
-            
-            # Make script executable on Unix-like systems
-            if self.os_type != "Windows":
-                os.chmod(script_path, 0o755)
+            with CLITool._script_lock:
+                self._check_script_dir()
+                
+                # Files only appear under their final name once fully written; anything
+                # there that this user did not write is replaced rather than run
+                try:
+                    st = os.lstat(script_path)
+                    reuse = stat.S_ISREG(st.st_mode) and _is_private(st)
+                except FileNotFoundError:
+                    reuse = False
+                
+                if not reuse:
+                    self._write_script(script_path, script)
+                
+                self._remember_script(script_path)
             
             # Execute script
-            command = script_path if self.os_type == "Windows" else f"./{script_file}"
+            command = script_path if self.os_type == "Windows" else shlex.quote(script_path)
             
             return self.execute({
                 "command": command,
                 "timeout": timeout,
-                "working_dir": working_dir
+                "working_dir": working_dir,
+                "stdout_path": stdout_path
             })
             
         except Exception as e:
@@ -201,13 +335,63 @@ class CLITool(Tool):
             self._set_result(result)
             self._set_status("idle")
             return result
-        finally:
-            # Clean up script file
+    
+    def _check_script_dir(self) -> None:
+        """
+        Create SCRIPT_DIR if needed and make sure no other user can plant scripts in it.
+        
+        Raises:
+            PermissionError: If the directory is a symlink, or is not private to this user
+        """
+        os.makedirs(self.SCRIPT_DIR, mode=0o700, exist_ok=True)
+        
+        st = os.lstat(self.SCRIPT_DIR)
+        if not stat.S_ISDIR(st.st_mode) or not _is_private(st):
+            raise PermissionError(f"Refusing to use script directory {self.SCRIPT_DIR}: "
+                                  f"it must be a directory owned by this user with mode 0700")
+    
+    def _write_script(self, script_path: str, script: str) -> None:
+        """
+        Atomically write a script file, executable on Unix-like systems.
+        
+        Args:
+            script_path (str): Path to the script file
+            script (str): Script content
+        """
+        # Created with its final mode in one call; O_EXCL never follows or reuses a file
+        temp_path = f"{script_path}.{os.urandom(8).hex()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o700)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(script)
+            os.replace(temp_path, script_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _remember_script(self, script_path: str) -> None:
+        """
+        Record a script file as recently used and evict the least recently used ones.
+        Must be called with _script_lock held.
+        
+        Args:
+            script_path (str): Path to the script file
+        """
+        cache = CLITool._script_cache
+        cache[script_path] = None
+        cache.move_to_end(script_path)
+        
+        while len(cache) > self.SCRIPT_CACHE_SIZE:
+            stale_path, _ = cache.popitem(last=False)
             try:
-                if os.path.exists(script_path):
-                    os.remove(script_path)
+                os.remove(stale_path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.warning(f"Failed to remove script file {script_path}: {str(e)}")
+                logger.warning(f"Failed to remove script file {stale_path}: {str(e)}")
     
     def list_directory(self, directory: str = None) -> Dict[str, Any]:
         """
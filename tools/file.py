@@ -5,18 +5,480 @@ Handles file operations.
 """
 
 import os
+import sys
+import mmap
+import base64
+import binascii
+import stat
+import errno
+import ctypes
 import shutil
 import logging
+import functools
 import json
+import math
+import re
 import csv
 import yaml
-from typing import Dict, Any, List, Optional, Union, BinaryIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union, BinaryIO
 
 from autobot.tools.base import Tool
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    from pyarrow import csv as pyarrow_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Bound once so hot paths avoid module attribute lookups
+_b64decode = base64.b64decode
+_b2a_base64 = binascii.b2a_base64
+
+# Plain and binary reads above this size go through mmap
+MMAP_READ_THRESHOLD = 16 * 1024 * 1024
+
+# Read buffer size for CSV files
+CSV_BUFFER_SIZE = 1 << 20
+
+# Text content above this size is encoded once and written unbuffered
+LARGE_WRITE_THRESHOLD = 1 << 20
+
+# Binary content at or above this size is written with O_DIRECT on Linux
+DIRECT_WRITE_THRESHOLD = 2 * 1024 * 1024
+
+# Buffer and length alignment for O_DIRECT writes
+DIRECT_IO_ALIGNMENT = 4096
+
+# Upper bound on threads used for concurrent file I/O
+IO_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Recursive listings whose root has more subdirectories than this are scanned concurrently
+PARALLEL_LISTING_MIN_SUBDIRS = 200
+
+# Chunk size for streaming base64 encoding (a multiple of 3 so chunks encode without padding)
+BASE64_CHUNK_SIZE = 3 * 1024 * 1024
+
+# Bounds for the userspace copy buffer, scaled with file size
+COPY_MIN_CHUNK_SIZE = 64 * 1024
+COPY_MAX_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Largest count passed to a single in-kernel copy call
+COPY_RANGE_MAX = 1 << 30
+
+# Digit runs long enough to be integers outside the 64-bit range that orjson handles
+JSON_BIG_INT_RE = re.compile(rb"\d{19,}")
+
+# Options for orjson.dumps, shared by results and written JSON files
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if ORJSON_AVAILABLE else 0
+
+# Errors meaning an in-kernel copy is unsupported for this pair of files
+COPY_FALLBACK_ERRNOS = frozenset([
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF
+])
+
+def _fast_copy(src: str, dst: str, exclusive: bool = False) -> str:
+    """
+    Copy a file and its metadata, keeping the data in the kernel where possible.
+    
+    On Linux this tries copy_file_range (reflink-capable on CoW filesystems), then
+    sendfile, then a userspace copy with a buffer sized to the file. Other
+    platforms use shutil.copy2. Usable as a shutil.copytree copy_function.
+    
+    Args:
+        src (str): Source file
+        dst (str): Destination file or directory
+        exclusive (bool, optional): Fail with FileExistsError if dst exists, instead of
+            replacing it (or copying into it, for a directory). Defaults to False.
+        
+    Returns:
+        str: Destination file path
+    """
+    if not sys.platform.startswith("linux"):
+        if exclusive and os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, "File exists", dst)
+        return shutil.copy2(src, dst)
+    
+    if not exclusive:
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        
+        # Opening dst for writing would truncate src if they are the same file
+        try:
+            if os.path.samefile(src, dst):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        except FileNotFoundError:
+            pass
+    
+    with open(src, "rb") as fsrc, open(dst, "xb" if exclusive else "wb") as fdst:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+        offset = 0
+        done = False
+        
+        if hasattr(os, "copy_file_range"):
+            try:
+                while True:
+                    copied = os.copy_file_range(infd, outfd, COPY_RANGE_MAX, offset, offset)
+                    if not copied:
+                        done = True
+                        break
+                    offset += copied
+            except OSError as e:
+                if e.errno not in COPY_FALLBACK_ERRNOS:
+                    raise
+        
+        if not done:
+            os.lseek(outfd, offset, os.SEEK_SET)
+            try:
+                while True:
+                    copied = os.sendfile(outfd, infd, offset, COPY_RANGE_MAX)
+                    if not copied:
+                        done = True
+                        break
+                    offset += copied
+            except OSError as e:
+                if e.errno not in COPY_FALLBACK_ERRNOS:
+                    raise
+        
+        if not done:
+            size = os.fstat(infd).st_size
+            chunk_size = min(max(size >> 10, COPY_MIN_CHUNK_SIZE), COPY_MAX_CHUNK_SIZE)
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            shutil.copyfileobj(fsrc, fdst, chunk_size)
+    
+    shutil.copystat(src, dst)
+    return dst
+
+def _write_all(f, data: bytes) -> None:
+    """
+    Write bytes to an unbuffered file, retrying on short writes.
+    
+    Args:
+        f: File object opened with buffering=0
+        data (bytes): Data to write
+    """
+    view = memoryview(data)
+    while view:
+        view = view[f.write(view):]
+
+def _write_direct(path: str, data: bytes) -> bool:
+    """
+    Write bytes with O_DIRECT from a page-aligned buffer, bypassing the page cache.
+    
+    The last block is zero-padded to the alignment and the file is then
+    truncated to the real size.
+    
+    Args:
+        path (str): Destination file
+        data (bytes): Data to write
+        
+    Returns:
+        bool: False if O_DIRECT is unsupported here (platform or filesystem), so the
+        caller should fall back to a buffered write
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "O_DIRECT"):
+        return False
+    
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            # Filesystem without O_DIRECT support (e.g. tmpfs)
+            return False
+        raise
+    
+    try:
+        size = len(data)
+        aligned_size = -(-size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT
+        
+        # Anonymous mmaps are page-aligned, as O_DIRECT requires
+        buf = mmap.mmap(-1, aligned_size)
+        try:
+            if hasattr(mmap, "MADV_HUGEPAGE"):
+                buf.madvise(mmap.MADV_HUGEPAGE)
+            buf[:size] = data
+            
+            with memoryview(buf) as view:
+                written = 0
+                while written < aligned_size:
+                    written += os.write(fd, view[written:])
+        finally:
+            buf.close()
+        
+        os.ftruncate(fd, size)
+        return True
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return False
+        raise
+    finally:
+        os.close(fd)
+
+def _drop_page_cache(f) -> None:
+    """
+    Advise the kernel that a just-written file will not be re-read soon.
+    
+    Args:
+        f: File object opened for writing
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    f.flush()
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+def _read_base64(f) -> str:
+    """
+    Read a binary file as base64 without holding the raw and encoded data together.
+    
+    Large files are mapped with mmap and encoded straight from the mapping.
+    
+    Args:
+        f: Binary file object opened for reading
+        
+    Returns:
+        str: Base64-encoded content
+    """
+    encoded = bytearray()
+    
+    if os.fstat(f.fileno()).st_size > MMAP_READ_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            for start in range(0, len(view), BASE64_CHUNK_SIZE):
+                encoded += _b2a_base64(view[start:start + BASE64_CHUNK_SIZE], newline=False)
+    else:
+        chunk = f.read(BASE64_CHUNK_SIZE)
+        while chunk:
+            encoded += _b2a_base64(chunk, newline=False)
+            chunk = f.read(BASE64_CHUNK_SIZE)
+    
+    return encoded.decode("ascii")
+
+def _read_text(f) -> str:
+    """
+    Read a UTF-8 text file, decoding large files directly from an mmap.
+    
+    Args:
+        f: Text file object opened for reading with UTF-8 encoding
+        
+    Returns:
+        str: File content
+    """
+    if os.fstat(f.fileno()).st_size > MMAP_READ_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            # Files with carriage returns need the text layer's newline translation
+            if mm.find(b"\r") == -1:
+                return str(view, "utf-8")
+    
+    return f.read()
+
+def _read_csv_rows(f) -> List[Dict[str, Any]]:
+    """
+    Read CSV rows as dictionaries keyed by the header row.
+    
+    Equivalent to list(csv.DictReader(f)), but zips each row with the header
+    directly instead of going through DictReader's per-row bookkeeping.
+    
+    Args:
+        f: Text file object opened for reading
+        
+    Returns:
+        List[Dict[str, Any]]: Rows
+    """
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return []
+    
+    width = len(header)
+    rows = []
+    append = rows.append
+    
+    for row in reader:
+        if len(row) == width:
+            append(dict(zip(header, row)))
+        elif row:
+            # Ragged rows: extra values go under None, missing values are None (as DictReader)
+            record = dict(zip(header, row))
+            if len(row) > width:
+                record[None] = row[width:]
+            else:
+                for key in header[len(row):]:
+                    record[key] = None
+            append(record)
+    
+    return rows
+
+def _has_non_finite(value: Any) -> bool:
+    """
+    Check whether a JSON-like structure contains a NaN or infinite float.
+    
+    Args:
+        value (Any): Value to check
+        
+    Returns:
+        bool: Whether any float in the structure is not finite
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes with orjson, falling back to json where orjson would differ.
+    
+    orjson rejects the NaN and Infinity literals json accepts, and cannot return
+    integers beyond 64 bits exactly, so such documents are parsed by json.
+    
+    Args:
+        data (bytes): JSON document
+        
+    Returns:
+        Any: Parsed value
+    """
+    if JSON_BIG_INT_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    
+    return json.loads(data)
+
+def _json_dumps(value: Any, indent: bool = False) -> bytes:
+    """
+    Serialize a value to UTF-8 JSON with orjson, falling back to json where orjson would differ.
+    
+    orjson raises on integers beyond 64 bits and writes NaN and infinities as null,
+    so such values are serialized by json instead.
+    
+    Args:
+        value (Any): Value to serialize
+        indent (bool, optional): Whether to indent by two spaces. Defaults to False.
+        
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else ORJSON_OPTIONS
+        try:
+            data = orjson.dumps(value, option=option)
+        except orjson.JSONEncodeError:
+            data = None
+        
+        # Non-finite floats come out as null; only then is the structure walked
+        if data is not None and not (b"null" in data and _has_non_finite(value)):
+            return data
+    
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+@functools.lru_cache(maxsize=1024)
+def _resolve(working_dir_abs: Optional[str], path: str) -> str:
+    """
+    Resolve a path against an absolute working directory (memoized).
+    
+    Args:
+        working_dir_abs (Optional[str]): Absolute working directory, or None
+        path (str): Path to resolve
+        
+    Returns:
+        str: Resolved path
+    """
+    if os.path.isabs(path):
+        return path
+    
+    if working_dir_abs:
+        return os.path.join(working_dir_abs, path)
+    
+    return path
+
+# statx(2) constants (Linux)
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+STATX_BUFFER_SIZE = 256
+STATX_MODE_OFFSET = 28
+
+def _load_statx():
+    """
+    Look up the libc statx wrapper once.
+    
+    Returns:
+        Optional[Callable]: statx function, or None if unavailable on this platform
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+    statx.restype = ctypes.c_int
+    return statx
+
+_statx = _load_statx()
+
+def _stat_mode(path: str) -> Optional[int]:
+    """
+    Get the file type bits of a path with a single syscall, following symlinks.
+    
+    Uses statx(STATX_TYPE, AT_STATX_DONT_SYNC) on Linux so only cached type
+    information is fetched, and os.stat elsewhere.
+    
+    Args:
+        path (str): Path to check
+        
+    Returns:
+        Optional[int]: st_mode of the path, or None if it does not exist
+    """
+    global _statx
+    
+    if _statx is not None and "\0" not in path:
+        buf = ctypes.create_string_buffer(STATX_BUFFER_SIZE)
+        if _statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC, STATX_TYPE, buf) == 0:
+            return int.from_bytes(buf.raw[STATX_MODE_OFFSET:STATX_MODE_OFFSET + 2], sys.byteorder)
+        
+        if ctypes.get_errno() != errno.ENOSYS:
+            return None
+        
+        # Kernel without statx, use os.stat from now on
+        _statx = None
+    
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
 class FileTool(Tool):
     """Tool for file operations."""
     
@@ -33,6 +495,20 @@ class FileTool(Tool):
         )
         
         self.working_dir = working_dir
+        self._working_dir_abs = os.path.abspath(working_dir) if working_dir else None
+        
+        # Operation handlers
+        self._dispatch = {
+            "read": self._read_file,
+            "write": self._write_file,
+            "append": self._append_file,
+            "list": self._list_directory,
+            "delete": self._delete_file,
+            "copy": self._copy_file,
+            "move": self._move_file,
+            "exists": self._file_exists,
+            "mkdir": self._make_directory
+        }
         
         logger.info(f"File Tool initialized")
     
@@ -42,7 +518,7 @@ class FileTool(Tool):
         
         Args:
             params (Dict[str, Any]): Operation parameters
-                - operation (str): Operation to perform (read, write, append, list, delete, copy, move, exists)
+                - operation (str): Operation to perform (read, write, append, list, delete, copy, move, exists, mkdir)
                 - Additional parameters specific to each operation
             
         Returns:
@@ -50,57 +526,91 @@ class FileTool(Tool):
         """
         self._set_status("running")
         
+        result = self._run_operation(params)
+        
+        self._set_result(result)
+        self._set_status("idle")
+        return result
+    
+    def execute_batch(self, params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several independent file operations, overlapping their I/O.
+        
+        Operations run concurrently on a thread pool (file syscalls release the GIL),
+        so they must not depend on each other's effects. A single operation runs inline.
+        
+        Args:
+            params_list (List[Dict[str, Any]]): Parameters for each operation, as for execute
+            
+        Returns:
+            List[Dict[str, Any]]: Operation results, in the same order as params_list
+        """
+        if len(params_list) < 2:
+            return [self.execute(params) for params in params_list]
+        
+        self._set_status("running")
+        
+        max_workers = min(len(params_list), IO_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._run_operation, params_list))
+        
+        self._set_result(results[-1])
+        self._set_status("idle")
+        return results
+    
+    @staticmethod
+    def serialize_result(result: Dict[str, Any]) -> bytes:
+        """
+        Serialize an operation result to JSON bytes.
+        
+        Uses orjson when installed, which is considerably faster than json.dumps for
+        results carrying large content (e.g. base64-encoded binary reads).
+        
+        Args:
+            result (Dict[str, Any]): Operation result
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return _json_dumps(result)
+    
+    def _run_operation(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Dispatch a single file operation.
+        
+        Args:
+            params (Dict[str, Any]): Operation parameters, as for execute
+            
+        Returns:
+            Dict[str, Any]: Operation result
+        """
         # Extract operation
         operation = params.get("operation")
         
         if not operation:
-            result = {
+            return {
                 "status": "error",
                 "error": "No operation provided"
             }
-            self._set_result(result)
-            self._set_status("idle")
-            return result
+        
+        handler = self._dispatch.get(operation) if isinstance(operation, str) else None
+        
+        if handler is None:
+            return {
+                "status": "error",
+                "error": f"Unknown operation: {operation}"
+            }
         
         try:
             # Dispatch to appropriate method
-            if operation == "read":
-                result = self._read_file(params)
-            elif operation == "write":
-                result = self._write_file(params)
-            elif operation == "append":
-                result = self._append_file(params)
-            elif operation == "list":
-                result = self._list_directory(params)
-            elif operation == "delete":
-                result = self._delete_file(params)
-            elif operation == "copy":
-                result = self._copy_file(params)
-            elif operation == "move":
-                result = self._move_file(params)
-            elif operation == "exists":
-                result = self._file_exists(params)
-            elif operation == "mkdir":
-                result = self._make_directory(params)
-            else:
-                result = {
-                    "status": "error",
-                    "error": f"Unknown operation: {operation}"
-                }
-            
-            self._set_result(result)
-            self._set_status("idle")
-            return result
+            return handler(params)
             
         except Exception as e:
-            result = {
+            return {
                 "status": "error",
                 "error": str(e),
                 "operation": operation
             }
-            self._set_result(result)
-            self._set_status("idle")
-            return result
     
     def _resolve_path(self, path: str) -> str:
         """
@@ -112,13 +622,7 @@ class FileTool(Tool):
         Returns:
             str: Resolved path
         """
-        if os.path.isabs(path):
-            return path
-        
-        if self.working_dir:
-            return os.path.join(self.working_dir, path)
-        
-        return path
+        return _resolve(self._working_dir_abs, path)
     
     def _read_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -128,7 +632,8 @@ class FileTool(Tool):
             params (Dict[str, Any]): Read parameters
                 - path (str): Path to file
                 - binary (bool, optional): Whether to read in binary mode. Defaults to False.
-                - format (str, optional): Format to parse (json, csv, yaml). Defaults to None.
+                - format (str, optional): Format to parse (json, csv, csv_arrow, yaml, msgpack). Defaults to None.
+                  csv_arrow parses with pyarrow's native reader and infers column types.
             
         Returns:
             Dict[str, Any]: Read result
@@ -145,22 +650,38 @@ class FileTool(Tool):
         
         resolved_path = self._resolve_path(path)
         
-        if not os.path.exists(resolved_path):
+        if format_type == "msgpack" and not MSGPACK_AVAILABLE:
             return {
                 "status": "error",
-                "error": f"File not found: {path}"
+                "error": "msgpack format requires the msgpack package: pip install msgpack",
+                "path": path
+            }
+        
+        if format_type == "csv_arrow" and not PYARROW_AVAILABLE:
+            return {
+                "status": "error",
+                "error": "csv_arrow format requires the pyarrow package: pip install pyarrow",
+                "path": path
             }
         
         try:
-            mode = "rb" if binary else "r"
-            encoding = None if binary else "utf-8"
+            if format_type == "csv_arrow":
+                return {
+                    "status": "success",
+                    "content": pyarrow_csv.read_csv(resolved_path).to_pylist(),
+                    "path": path
+                }
             
-            with open(resolved_path, mode, encoding=encoding) as f:
+            # orjson parses straight from bytes, so JSON is read in binary mode when available
+            raw = binary or format_type == "msgpack" or (format_type == "json" and ORJSON_AVAILABLE)
+            mode = "rb" if raw else "r"
+            encoding = None if raw else "utf-8"
+            buffering = CSV_BUFFER_SIZE if format_type == "csv" and not binary else -1
+            
+            with open(resolved_path, mode, buffering=buffering, encoding=encoding) as f:
                 if binary:
-                    content = f.read()
                     # Convert bytes to base64 for JSON serialization
-                    import base64
-                    content = base64.b64encode(content).decode("ascii")
+                    content = _read_base64(f)
                     return {
                         "status": "success",
                         "content": content,
@@ -169,14 +690,18 @@ class FileTool(Tool):
                     }
                 
                 if format_type == "json":
-                    content = json.load(f)
+                    if ORJSON_AVAILABLE:
+                        content = _json_loads(f.read())
+                    else:
+                        content = json.load(f)
                 elif format_type == "csv":
-                    reader = csv.DictReader(f)
-                    content = list(reader)
+                    content = _read_csv_rows(f)
                 elif format_type == "yaml":
-                    content = yaml.safe_load(f)
+                    content = yaml.load(f, Loader=_YamlLoader)
+                elif format_type == "msgpack":
+                    content = msgpack.unpackb(f.read(), raw=False)
                 else:
-                    content = f.read()
+                    content = _read_text(f)
                 
                 return {
                     "status": "success",
@@ -184,6 +709,11 @@ class FileTool(Tool):
                     "path": path
                 }
                 
+        except FileNotFoundError:
+            return {
+                "status": "error",
+                "error": f"File not found: {path}"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -200,8 +730,10 @@ class FileTool(Tool):
                 - path (str): Path to file
                 - content (Union[str, bytes, Dict, List]): Content to write
                 - binary (bool, optional): Whether to write in binary mode. Defaults to False.
-                - format (str, optional): Format to write (json, csv, yaml). Defaults to None.
+                - format (str, optional): Format to write (json, csv, yaml, msgpack). Defaults to None.
                 - overwrite (bool, optional): Whether to overwrite existing file. Defaults to True.
+                - drop_cache (bool, optional): Whether to drop the written data from the page cache,
+                  for files that will not be re-read soon. Defaults to False.
             
         Returns:
             Dict[str, Any]: Write result
@@ -211,6 +743,7 @@ class FileTool(Tool):
         binary = params.get("binary", False)
         format_type = params.get("format")
         overwrite = params.get("overwrite", True)
+        drop_cache = params.get("drop_cache", False)
         
         if not path:
             return {
@@ -232,37 +765,34 @@ class FileTool(Tool):
                 "error": f"File already exists: {path}"
             }
         
+        if format_type == "msgpack" and not MSGPACK_AVAILABLE:
+            return {
+                "status": "error",
+                "error": "msgpack format requires the msgpack package: pip install msgpack",
+                "path": path
+            }
+        
+        if format_type == "csv" and (not isinstance(content, list) or not content):
+            return {
+                "status": "error",
+                "error": "CSV content must be a non-empty list of dictionaries",
+                "path": path
+            }
+        
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
+            if binary and isinstance(content, str):
+                # If content is base64 encoded
+                content = _b64decode(content)
             
-            mode = "wb" if binary else "w"
-            encoding = None if binary else "utf-8"
-            
-            with open(resolved_path, mode, encoding=encoding) as f:
-                if binary:
-                    # If content is base64 encoded
-                    if isinstance(content, str):
-                        import base64
-                        content = base64.b64decode(content)
-                    f.write(content)
-                elif format_type == "json":
-                    json.dump(content, f, indent=2)
-                elif format_type == "csv":
-                    if not isinstance(content, list) or not content:
-                        return {
-                            "status": "error",
-                            "error": "CSV content must be a non-empty list of dictionaries",
-                            "path": path
-                        }
-                    
-                    writer = csv.DictWriter(f, fieldnames=content[0].keys())
-                    writer.writeheader()
-                    writer.writerows(content)
-                elif format_type == "yaml":
-                    yaml.dump(content, f)
-                else:
-                    f.write(content)
+            try:
+                self._write_content(resolved_path, content, binary, format_type, drop_cache)
+            except FileNotFoundError:
+                # Parent directory is missing: create it and retry
+                directory = os.path.dirname(resolved_path)
+                if not directory:
+                    raise
+                os.makedirs(directory, exist_ok=True)
+                self._write_content(resolved_path, content, binary, format_type, drop_cache)
             
             return {
                 "status": "success",
@@ -277,6 +807,63 @@ class FileTool(Tool):
                 "path": path
             }
     
+    def _write_content(self, resolved_path: str, content: Any, binary: bool,
+                       format_type: Optional[str], drop_cache: bool) -> None:
+        """
+        Write content to a file, serializing it according to format_type.
+        
+        Args:
+            resolved_path (str): Resolved path to file
+            content (Any): Content to write (already base64-decoded if binary)
+            binary (bool): Whether content is raw bytes
+            format_type (Optional[str]): Format to write (json, csv, yaml, msgpack)
+            drop_cache (bool): Whether to drop the written data from the page cache
+        """
+        written_direct = (binary and len(content) >= DIRECT_WRITE_THRESHOLD
+                          and _write_direct(resolved_path, content))
+        
+        if written_direct:
+            # Data went straight to the device, bypassing the page cache
+            return
+        
+        if (not binary and format_type is None and isinstance(content, str)
+                and len(content) > LARGE_WRITE_THRESHOLD):
+            # Large plain text: encode once and write it with a single unbuffered write
+            if os.linesep != "\n":
+                content = content.replace("\n", os.linesep)
+            with open(resolved_path, "wb", buffering=0) as f:
+                _write_all(f, content.encode("utf-8"))
+                if drop_cache:
+                    _drop_page_cache(f)
+            return
+        
+        # orjson emits bytes, so JSON is written in binary mode when available
+        raw = binary or format_type == "msgpack" or (format_type == "json" and ORJSON_AVAILABLE)
+        mode = "wb" if raw else "w"
+        encoding = None if raw else "utf-8"
+        
+        with open(resolved_path, mode, encoding=encoding) as f:
+            if binary:
+                f.write(content)
+            elif format_type == "json":
+                if ORJSON_AVAILABLE:
+                    f.write(_json_dumps(content, indent=True))
+                else:
+                    json.dump(content, f, indent=2)
+            elif format_type == "csv":
+                writer = csv.DictWriter(f, fieldnames=content[0].keys())
+                writer.writeheader()
+                writer.writerows(content)
+            elif format_type == "yaml":
+                yaml.dump(content, f, Dumper=_YamlDumper, default_flow_style=False)
+            elif format_type == "msgpack":
+                f.write(msgpack.packb(content, use_bin_type=True))
+            else:
+                f.write(content)
+            
+            if drop_cache:
+                _drop_page_cache(f)
+    
     def _append_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Append to a file.
@@ -309,18 +896,24 @@ class FileTool(Tool):
         resolved_path = self._resolve_path(path)
         
         try:
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
+            if binary and isinstance(content, str):
+                # If content is base64 encoded
+                content = _b64decode(content)
             
             mode = "ab" if binary else "a"
             encoding = None if binary else "utf-8"
             
-            with open(resolved_path, mode, encoding=encoding) as f:
-                if binary and isinstance(content, str):
-                    # If content is base64 encoded
-                    import base64
-                    content = base64.b64decode(content)
-                
+            try:
+                f = open(resolved_path, mode, encoding=encoding)
+            except FileNotFoundError:
+                # Parent directory is missing: create it and retry
+                directory = os.path.dirname(resolved_path)
+                if not directory:
+                    raise
+                os.makedirs(directory, exist_ok=True)
+                f = open(resolved_path, mode, encoding=encoding)
+            
+            with f:
                 f.write(content)
             
             return {
@@ -379,38 +972,20 @@ class FileTool(Tool):
             if recursive:
                 items = []
                 
-                for root, dirs, files in os.walk(resolved_path):
-                    # Skip hidden directories if not include_hidden
-                    if not include_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith(".")]
-                    
-                    for file in files:
-                        if include_hidden or not file.startswith("."):
-                            rel_path = os.path.relpath(os.path.join(root, file), resolved_path)
-                            items.append({
-                                "name": file,
-                                "path": os.path.join(path, rel_path) if full_paths else rel_path,
-                                "type": "file"
-                            })
-                    
-                    for dir_name in dirs:
-                        rel_path = os.path.relpath(os.path.join(root, dir_name), resolved_path)
-                        items.append({
-                            "name": dir_name,
-                            "path": os.path.join(path, rel_path) if full_paths else rel_path,
-                            "type": "directory"
-                        })
+                prefix = os.path.join(path, "") if full_paths else ""
+                self._walk_directory(resolved_path, prefix, include_hidden, items)
             else:
                 items = []
                 
-                for item in os.listdir(resolved_path):
-                    if include_hidden or not item.startswith("."):
-                        item_path = os.path.join(resolved_path, item)
-                        items.append({
-                            "name": item,
-                            "path": os.path.join(path, item) if full_paths else item,
-                            "type": "directory" if os.path.isdir(item_path) else "file"
-                        })
+                with os.scandir(resolved_path) as entries:
+                    for entry in entries:
+                        item = entry.name
+                        if include_hidden or not item.startswith("."):
+                            items.append({
+                                "name": item,
+                                "path": os.path.join(path, item) if full_paths else item,
+                                "type": self._entry_type(entry)
+                            })
             
             return {
                 "status": "success",
@@ -426,6 +1001,133 @@ class FileTool(Tool):
                 "path": path
             }
     
+    def _entry_type(self, entry: os.DirEntry) -> str:
+        """
+        Classify a directory entry, following symlinks like os.path.isdir.
+        
+        Regular entries are classified from the type cached by the directory read;
+        only symlinks need a stat of their target.
+        
+        Args:
+            entry (os.DirEntry): Directory entry
+            
+        Returns:
+            str: "directory" or "file"
+        """
+        if not entry.is_symlink():
+            return "directory" if entry.is_dir(follow_symlinks=False) else "file"
+        
+        try:
+            mode = entry.stat().st_mode
+        except OSError:
+            # Broken symlink
+            mode = 0
+        
+        return "directory" if stat.S_ISDIR(mode) else "file"
+    
+    def _walk_directory(self, directory: str, prefix: str, include_hidden: bool,
+                        items: List[Dict[str, Any]]) -> None:
+        """
+        List a directory tree breadth-first with os.scandir, appending entries to items.
+        
+        Each directory is scanned exactly once and its entries are emitted in scan
+        order, with reported paths built by prefix concatenation. Symlinked
+        directories are listed but not descended into. Wide trees are handed to
+        _walk_directory_parallel after the root scan.
+        
+        Args:
+            directory (str): Resolved root directory to scan
+            prefix (str): String prepended to entry names in the root to form their reported path
+            include_hidden (bool): Whether to include hidden entries
+            items (List[Dict[str, Any]]): Output list
+        """
+        root_items, subdirs = self._scan_directory(directory, prefix, include_hidden)
+        items.extend(root_items)
+        
+        if len(subdirs) > PARALLEL_LISTING_MIN_SUBDIRS:
+            self._walk_directory_parallel(subdirs, include_hidden, items)
+            return
+        
+        scan = self._scan_directory
+        pending = deque(subdirs)
+        
+        while pending:
+            current, current_prefix = pending.popleft()
+            dir_items, subdirs = scan(current, current_prefix, include_hidden)
+            items.extend(dir_items)
+            pending.extend(subdirs)
+    
+    def _walk_directory_parallel(self, level: List[Tuple[str, str]], include_hidden: bool,
+                                 items: List[Dict[str, Any]]) -> None:
+        """
+        Continue a breadth-first listing with directory scans spread over a thread pool.
+        
+        scandir releases the GIL, so scans of sibling directories overlap. Each level
+        is submitted in bounded batches, and results are merged in submission order,
+        so the output matches the serial walk.
+        
+        Args:
+            level (List[Tuple[str, str]]): (directory, prefix) pairs of the next level to scan
+            include_hidden (bool): Whether to include hidden entries
+            items (List[Dict[str, Any]]): Output list
+        """
+        def scan(pair: Tuple[str, str]) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+            return self._scan_directory(pair[0], pair[1], include_hidden)
+        
+        batch_size = IO_MAX_WORKERS * 4
+        
+        with ThreadPoolExecutor(max_workers=IO_MAX_WORKERS) as executor:
+            while level:
+                next_level = []
+                for start in range(0, len(level), batch_size):
+                    for dir_items, subdirs in executor.map(scan, level[start:start + batch_size]):
+                        items.extend(dir_items)
+                        next_level.extend(subdirs)
+                level = next_level
+    
+    def _scan_directory(self, directory: str, prefix: str,
+                        include_hidden: bool) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+        """
+        Scan a single directory for a recursive listing.
+        
+        Args:
+            directory (str): Resolved directory to scan
+            prefix (str): String prepended to entry names to form their reported path
+            include_hidden (bool): Whether to include hidden entries
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]: Listing items, and
+            (directory, prefix) pairs of the subdirectories to descend into
+        """
+        items = []
+        subdirs = []
+        append = items.append
+        entry_type = self._entry_type
+        startswith = str.startswith
+        
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not include_hidden and startswith(name, "."):
+                        continue
+                    
+                    item_type = entry_type(entry)
+                    item_path = prefix + name
+                    append({
+                        "name": name,
+                        "path": item_path,
+                        "type": item_type
+                    })
+                    
+                    if item_type == "directory" and not entry.is_symlink():
+                        subdirs.append((entry.path, item_path + os.sep))
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            return [], []
+        
+        return items, subdirs
+    
     def _delete_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Delete a file or directory.
@@ -503,28 +1205,26 @@ class FileTool(Tool):
         resolved_source = self._resolve_path(source)
         resolved_destination = self._resolve_path(destination)
         
-        if not os.path.exists(resolved_source):
+        source_mode = _stat_mode(resolved_source)
+        
+        if source_mode is None:
             return {
                 "status": "error",
                 "error": f"Source not found: {source}"
             }
         
-        if os.path.exists(resolved_destination) and not overwrite:
-            return {
-                "status": "error",
-                "error": f"Destination already exists: {destination}"
-            }
+        source_is_dir = stat.S_ISDIR(source_mode)
         
         try:
-            # Create destination directory if it doesn't exist
-            os.makedirs(os.path.dirname(resolved_destination), exist_ok=True)
-            
-            if os.path.isdir(resolved_source):
-                if os.path.exists(resolved_destination):
-                    shutil.rmtree(resolved_destination)
-                shutil.copytree(resolved_source, resolved_destination)
-            else:
-                shutil.copy2(resolved_source, resolved_destination)
+            try:
+                self._copy_entry(resolved_source, resolved_destination, source_is_dir, overwrite)
+            except FileNotFoundError as e:
+                # Destination directory is missing: create it and retry
+                directory = os.path.dirname(resolved_destination)
+                if e.filename == resolved_source or not directory:
+                    raise
+                os.makedirs(directory, exist_ok=True)
+                self._copy_entry(resolved_source, resolved_destination, source_is_dir, overwrite)
             
             return {
                 "status": "success",
@@ -533,6 +1233,11 @@ class FileTool(Tool):
                 "destination": destination
             }
             
+        except FileExistsError:
+            return {
+                "status": "error",
+                "error": f"Destination already exists: {destination}"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -567,29 +1272,24 @@ class FileTool(Tool):
         resolved_source = self._resolve_path(source)
         resolved_destination = self._resolve_path(destination)
         
-        if not os.path.exists(resolved_source):
+        try:
+            source_is_dir = stat.S_ISDIR(os.lstat(resolved_source).st_mode)
+        except (OSError, ValueError):
             return {
                 "status": "error",
                 "error": f"Source not found: {source}"
             }
         
-        if os.path.exists(resolved_destination) and not overwrite:
-            return {
-                "status": "error",
-                "error": f"Destination already exists: {destination}"
-            }
-        
         try:
-            # Create destination directory if it doesn't exist
-            os.makedirs(os.path.dirname(resolved_destination), exist_ok=True)
-            
-            if os.path.exists(resolved_destination) and overwrite:
-                if os.path.isdir(resolved_destination):
-                    shutil.rmtree(resolved_destination)
-                else:
-                    os.remove(resolved_destination)
-            
-            shutil.move(resolved_source, resolved_destination)
+            try:
+                self._move_entry(resolved_source, resolved_destination, source_is_dir, overwrite)
+            except FileNotFoundError:
+                # The source was just found, so the destination directory is missing
+                directory = os.path.dirname(resolved_destination)
+                if not directory:
+                    raise
+                os.makedirs(directory, exist_ok=True)
+                self._move_entry(resolved_source, resolved_destination, source_is_dir, overwrite)
             
             return {
                 "status": "success",
@@ -598,6 +1298,11 @@ class FileTool(Tool):
                 "destination": destination
             }
             
+        except FileExistsError:
+            return {
+                "status": "error",
+                "error": f"Destination already exists: {destination}"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -606,6 +1311,94 @@ class FileTool(Tool):
                 "destination": destination
             }
     
+    def _copy_entry(self, src: str, dst: str, src_is_dir: bool, overwrite: bool) -> None:
+        """
+        Copy a file or directory tree, letting the OS report conflicts.
+        
+        Args:
+            src (str): Resolved source path
+            dst (str): Resolved destination path
+            src_is_dir (bool): Whether the source is a directory
+            overwrite (bool): Whether to replace an existing destination
+            
+        Raises:
+            FileExistsError: If dst exists and overwrite is False
+        """
+        if not src_is_dir:
+            _fast_copy(src, dst, exclusive=not overwrite)
+            return
+        
+        try:
+            shutil.copytree(src, dst, copy_function=_fast_copy)
+        except FileExistsError:
+            if not overwrite:
+                raise
+            self._remove_path(dst)
+            shutil.copytree(src, dst, copy_function=_fast_copy)
+    
+    def _move_entry(self, src: str, dst: str, src_is_dir: bool, overwrite: bool) -> None:
+        """
+        Move a file or directory, using a single rename/link when possible.
+        
+        Args:
+            src (str): Resolved source path
+            dst (str): Resolved destination path
+            src_is_dir (bool): Whether the source is a directory (not following symlinks)
+            overwrite (bool): Whether to replace an existing destination
+            
+        Raises:
+            FileExistsError: If dst exists and overwrite is False
+        """
+        if overwrite:
+            try:
+                os.replace(src, dst)
+                return
+            except FileNotFoundError:
+                raise
+            except OSError:
+                # Destination is a directory, or the move crosses filesystems
+                if os.path.lexists(dst):
+                    self._remove_path(dst)
+                shutil.move(src, dst)
+                return
+        
+        if not src_is_dir:
+            # A hard link fails atomically if dst exists, unlike rename
+            try:
+                os.link(src, dst, follow_symlinks=False)
+            except (FileExistsError, FileNotFoundError):
+                raise
+            except (OSError, NotImplementedError):
+                # Cross-device or no hard link support
+                if os.path.lexists(dst):
+                    raise FileExistsError(errno.EEXIST, "File exists", dst)
+                shutil.move(src, dst)
+                return
+            os.unlink(src)
+            return
+        
+        # rename would silently replace an empty destination directory
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, "File exists", dst)
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
+    
+    def _remove_path(self, path: str) -> None:
+        """
+        Remove a file, symlink or directory tree.
+        
+        Args:
+            path (str): Resolved path
+        """
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    
     def _file_exists(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Check if a file or directory exists.
@@ -627,9 +1420,10 @@ class FileTool(Tool):
         
         resolved_path = self._resolve_path(path)
         
-        exists = os.path.exists(resolved_path)
-        is_file = os.path.isfile(resolved_path) if exists else False
-        is_dir = os.path.isdir(resolved_path) if exists else False
+        mode = _stat_mode(resolved_path)
+        exists = mode is not None
+        is_file = exists and stat.S_ISREG(mode)
+        is_dir = exists and stat.S_ISDIR(mode)
         
         return {
             "status": "success",
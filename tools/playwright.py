@@ -8,23 +8,245 @@ import os
 import json
 import logging
 import time
-from typing import Dict, Any, List, Optional, Union
+import asyncio
+import threading
+import contextvars
+import functools
+import base64
+import hashlib
+import tempfile
+from concurrent.futures import Future
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from autobot.tools.base import Tool
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Session used when a request does not name one
+DEFAULT_SESSION_ID = "default"
+
+# Size limit for Chromium's disk cache when a cache directory is given (500 MB)
+DISK_CACHE_SIZE = 500 * 1024 * 1024
+
+# Where persist_state saves cookies and local storage unless a path is given
+DEFAULT_STATE_PATH = ".playwright_state.json"
+
+# Network.emulateNetworkConditions fields left unthrottled unless the caller sets them
+NO_THROTTLE = {
+    "offline": False,
+    "latency": 0,
+    "downloadThroughput": -1,
+    "uploadThroughput": -1
+}
+
+# JPEG quality used for screenshots unless the caller picks one
+DEFAULT_JPEG_QUALITY = 70
+
+# Actions that wait for the elements they need, so a preceding navigation in a chain
+# only has to reach DOMContentLoaded instead of the full load event
+DOM_READY_ACTIONS = frozenset([
+    "wait_for_selector", "wait_for_navigation", "get_text", "get_html",
+    "evaluate", "click", "type", "fill_form", "get_many"
+])
+
+# Reads the page URL and title in a single round-trip
+PAGE_SNAPSHOT_JS = "() => ({url: location.href, title: document.title})"
+
+# Fills text fields in one round-trip; returns the selectors it could not fill so they
+# can go through page.fill. The native value setter keeps framework-controlled inputs in sync.
+FILL_FORM_JS = """(data) => {
+    const missing = [];
+    for (const [selector, value] of Object.entries(data)) {
+        let el = null;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            // Not a CSS selector
+        }
+        if (!el || el.disabled || el.readOnly ||
+                !el.matches('input:not([type=checkbox]):not([type=radio]):not([type=file]), textarea, select')) {
+            missing.push(selector);
+            continue;
+        }
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+        el.focus();
+        setter.call(el, String(value));
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return missing;
+}"""
+
+# Reads text, inner HTML or an attribute of several elements in one round-trip;
+# elements that are missing (or selectors that are not CSS) map to null
+GET_MANY_JS = """([selectors, kind, attribute]) => Object.fromEntries(
+    Object.entries(selectors).map(([key, selector]) => {
+        let el = null;
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {
+            // Not a CSS selector
+        }
+        if (!el) {
+            return [key, null];
+        }
+        if (kind === 'html') {
+            return [key, el.innerHTML];
+        }
+        if (kind === 'attr') {
+            return [key, el.getAttribute(attribute)];
+        }
+        return [key, el.textContent];
+    })
+)"""
+
+# Serializes one subtree, cut to a maximum length in the page so only that much crosses IPC
+SCOPED_HTML_JS = """([scope, maxLength]) => {
+    const el = document.querySelector(scope);
+    const html = el ? el.outerHTML : '';
+    return maxLength && html.length > maxLength ? [html.slice(0, maxLength), true] : [html, false];
+}"""
+
+def _err(message: str, **fields: Any) -> Dict[str, Any]:
+    """
+    Build an error result.
+    
+    Args:
+        message (str): Error message
+        **fields: Extra result fields
+        
+    Returns:
+        Dict[str, Any]: Error result
+    """
+    return {"status": "error", "error": message, **fields}
+
+# Parameters each action requires, as (name, error message, whether empty values are allowed)
+REQUIRED_PARAMS = {
+    "goto": (("url", "No URL provided", False),),
+    "fast_goto": (("url", "No URL provided", False),),
+    "click": (("selector", "No selector provided", False),),
+    "type": (("selector", "No selector provided", False), ("text", "No text provided", True)),
+    "get_text": (("selector", "No selector provided", False),),
+    "get_many": (("selectors", "No selectors provided", False),),
+    "evaluate": (("expression", "No expression provided", False),),
+    "wait_for_selector": (("selector", "No selector provided", False),),
+    "fill_form": (("form_data", "No form data provided", False),),
+    "chain": (("steps", "No steps provided", False),)
+}
+
+# Session of the action being run; each dispatched coroutine runs in its own context copy
+_SESSION_ID: contextvars.ContextVar = contextvars.ContextVar("playwright_session_id", default=DEFAULT_SESSION_ID)
+
+# Event loop and Playwright driver shared by all tool instances
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_playwright = None
+_start_lock = threading.Lock()
+
+# Browsers shared by all tool instances, by launch options: {"browser": Browser, "refs": int}
+_BROWSER_POOL: Dict[tuple, Dict[str, Any]] = {}
+_pool_lock: Optional[asyncio.Lock] = None
+
+def _start_playwright() -> Tuple[asyncio.AbstractEventLoop, Any]:
+    """
+    Start the shared Playwright driver on a background event loop, once per process.
+    
+    Returns:
+        Tuple[asyncio.AbstractEventLoop, Any]: Event loop and Playwright instance
+        
+    Raises:
+        ImportError: If playwright is not installed
+        Exception: If the driver failed to start; a later call tries again
+    """
+    global _loop, _playwright
+    
+    with _start_lock:
+        if _playwright is None:
+            from playwright.async_api import async_playwright
+            
+            # All Playwright calls run on one background event loop so actions can overlap
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="playwright-loop", daemon=True)
+            thread.start()
+            
+            try:
+                _playwright = asyncio.run_coroutine_threadsafe(async_playwright().start(), loop).result()
+            except BaseException:
+                # Don't leave a loop thread behind for every failed start
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+                raise
+            
+            _loop = loop
+    
+    return _loop, _playwright
+
+async def _acquire_browser(launch_key: tuple, browser_type: str, browser_options: Dict[str, Any]) -> Any:
+    """
+    Get the shared browser for a set of launch options, launching it if needed.
+    
+    Args:
+        launch_key (tuple): Launch options identifying the browser
+        browser_type (str): Browser type (chromium, firefox, webkit)
+        browser_options (Dict[str, Any]): Options passed to launch
+        
+    Returns:
+        Any: Browser
+    """
+    global _pool_lock
+    
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+    
+    async with _pool_lock:
+        entry = _BROWSER_POOL.get(launch_key)
+        
+        if entry is None or not entry["browser"].is_connected():
+            entry = {
+                "browser": await getattr(_playwright, browser_type).launch(**browser_options),
+                "refs": 0
+            }
+            _BROWSER_POOL[launch_key] = entry
+        
+        entry["refs"] += 1
+        return entry["browser"]
+
+async def _release_browser(launch_key: tuple, browser: Any) -> None:
+    """
+    Drop a reference to a shared browser, closing it when no tool uses it any more.
+    
+    Args:
+        launch_key (tuple): Launch options identifying the browser
+        browser (Any): Browser returned by _acquire_browser
+    """
+    async with _pool_lock:
+        entry = _BROWSER_POOL.get(launch_key)
+        
+        if entry is not None and entry["browser"] is browser:
+            entry["refs"] -= 1
+            if entry["refs"] > 0:
+                return
+            del _BROWSER_POOL[launch_key]
+    
+    try:
+        await browser.close()
+    except Exception as e:
+        logger.warning(f"Failed to close browser: {str(e)}")
+
 class PlaywrightTool(Tool):
     """Tool for browser automation using Playwright."""
     
-    def __init__(self, user_data_dir: Optional[str] = None, headless: bool = False):
+    def __init__(self, user_data_dir: Optional[str] = None, headless: bool = False, max_contexts: int = 8):
         """
         Initialize the Playwright tool.
         
         Args:
             user_data_dir (str, optional): Path to user data directory. Defaults to None.
             headless (bool, optional): Whether to run in headless mode. Defaults to False.
+            max_contexts (int, optional): Maximum number of browser contexts kept open before
+                the least recently used one is closed. Defaults to 8.
         """
         super().__init__(
             name="playwright",
@@ -33,110 +255,323 @@ class PlaywrightTool(Tool):
         
         self.user_data_dir = user_data_dir
         self.headless = headless
+        self.max_contexts = max_contexts
         self.browser = None
-        self.page = None
+        self.browser_type = None
+        self._launch_key = None
         
-        # Try to import playwright
-        try:
-            from playwright.sync_api import sync_playwright
-            self.playwright = sync_playwright().__enter__()
-            self.available = True
-            logger.info("Playwright Tool initialized successfully")
-        except ImportError:
-            logger.error("Failed to import playwright. Please install it with: pip install playwright")
-            logger.error("Then install browsers with: playwright install")
-            self.available = False
+        # Shared browsers this tool holds a reference to, by launch options
+        self._browsers: Dict[tuple, Any] = {}
+        
+        # Launch options of the browser each non-persistent session's context runs in
+        self._session_keys: Dict[str, tuple] = {}
+        
+        # Browsers are shared with other instances; each session gets its own context and page (LRU order)
+        self._contexts: "OrderedDict[str, Any]" = OrderedDict()
+        self._pages: Dict[str, Any] = {}
+        
+        # URL and title of each session's page, dropped when the page navigates
+        self._snapshots: Dict[str, Dict[str, str]] = {}
+        
+        # SHA-256 of each session's last screenshot, dropped when the page navigates
+        self._screenshot_hashes: Dict[str, bytes] = {}
+        
+        # CDP session of each Chromium session's page, when network emulation is in use
+        self._cdp_sessions: Dict[str, Any] = {}
+        
+        # Functions registered with evaluate's cache_as, per session (name -> source)
+        self._exposed: Dict[str, Dict[str, str]] = {}
+        
+        # Storage state file of each session opened with persist_state
+        self._state_paths: Dict[str, str] = {}
+        
+        self._browser_lock: Optional[asyncio.Lock] = None
+        
+        # Action handlers by action name
+        self._handlers = {
+            "open": self._open_browser,
+            "close": self._close_browser,
+            "goto": self._goto,
+            "fast_goto": self._fast_goto,
+            "click": self._click,
+            "type": self._type,
+            "screenshot": self._screenshot,
+            "get_text": self._get_text,
+            "get_html": self._get_html,
+            "get_many": self._get_many,
+            "evaluate": self._evaluate,
+            "wait_for_selector": self._wait_for_selector,
+            "wait_for_navigation": self._wait_for_navigation,
+            "fill_form": self._fill_form,
+            "chain": self._chain
+        }
+        
+        # Playwright is started on first use; None until then
+        self._loop = None
+        self.playwright = None
+        self.available = None
+        self._start_error: Optional[str] = None
+        
+        logger.info("Playwright Tool initialized")
+    
+    def _ensure_playwright(self) -> bool:
+        """
+        Start Playwright on first use, so tools that never run an action skip the driver startup.
+        
+        Returns:
+            bool: Whether Playwright is available
+        """
+        if self.available is None:
+            # Try to import playwright
+            try:
+                self._loop, self.playwright = _start_playwright()
+                self.available = True
+                logger.info("Playwright initialized lazily")
+            except ImportError:
+                logger.error("Failed to import playwright. Please install it with: pip install playwright")
+                logger.error("Then install browsers with: playwright install")
+                self.available = False
+            except Exception as e:
+                # Possibly transient, so availability stays unknown and the next action retries
+                logger.error(f"Failed to start Playwright: {str(e)}")
+                self._start_error = str(e)
+                return False
+        
+        return self.available
+    
+    @property
+    def page(self) -> Optional[Any]:
+        """Page of the session the current action runs in, if it has one."""
+        return self._pages.get(_SESSION_ID.get())
+    
+    @property
+    def _session_id(self) -> str:
+        """Session the current action runs in."""
+        return _SESSION_ID.get()
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Execute a Playwright command.
+        Execute a Playwright command, blocking until it completes.
+        
+        Calls from several threads run concurrently on the tool's event loop.
         
         Args:
             params (Dict[str, Any]): Command parameters
-                - action (str): Action to perform (open, goto, click, type, screenshot, etc.)
+                - action (str): Action to perform (open, goto, click, type, screenshot, etc.).
+                  Use "chain" to run several actions in one call, and prefer "click" with
+                  expect_navigation over a click followed by "wait_for_navigation".
+                - session_id (str, optional): Browser context to act on. Defaults to "default".
                 - Additional parameters specific to each action
             
         Returns:
             Dict[str, Any]: Execution result
         """
-        self._set_status("running")
+        return self._submit(params).result()
+    
+    async def execute_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a Playwright command from a coroutine.
         
-        if not self.available:
-            result = {
-                "status": "error",
-                "error": "Playwright is not available"
-            }
+        Awaiting several of these (e.g. with asyncio.gather) runs the actions concurrently.
+        
+        Args:
+            params (Dict[str, Any]): Command parameters, as for execute
+            
+        Returns:
+            Dict[str, Any]: Execution result
+        """
+        return await asyncio.wrap_future(self._submit(params))
+    
+    def _submit(self, params: Dict[str, Any]) -> Future:
+        """
+        Schedule a command on the tool's event loop.
+        
+        Args:
+            params (Dict[str, Any]): Command parameters
+            
+        Returns:
+            Future: Future resolving to the execution result
+        """
+        if not self._ensure_playwright():
+            if self.available is None:
+                result = _err(f"Failed to start Playwright: {self._start_error}")
+            else:
+                result = _err("Playwright is not available")
             self._set_result(result)
             self._set_status("idle")
-            return result
+            
+            future = Future()
+            future.set_result(result)
+            return future
+        
+        return asyncio.run_coroutine_threadsafe(self._dispatch(params), self._loop)
+    
+    async def _dispatch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a command on the tool's event loop.
+        
+        Args:
+            params (Dict[str, Any]): Command parameters
+            
+        Returns:
+            Dict[str, Any]: Execution result
+        """
+        self._set_status("running")
         
         # Extract action
         action = params.get("action")
+        result = None
         
-        if not action:
-            result = {
-                "status": "error",
-                "error": "No action provided"
-            }
+        try:
+            if not action:
+                result = _err("No action provided")
+            else:
+                # Act on the page of the requested session
+                _SESSION_ID.set(params.get("session_id", DEFAULT_SESSION_ID))
+                self._snapshots.pop(self._session_id, None)
+                if self.page:
+                    self._contexts.move_to_end(self._session_id)
+                
+                result = await self._run_action(action, params)
+        except Exception as e:
+            result = _err(str(e), action=action)
+        finally:
             self._set_result(result)
             self._set_status("idle")
-            return result
         
-        try:
-            # Dispatch to appropriate method
-            if action == "open":
-                result = self._open_browser(params)
-            elif action == "close":
-                result = self._close_browser(params)
-            elif action == "goto":
-                result = self._goto(params)
-            elif action == "click":
-                result = self._click(params)
-            elif action == "type":
-                result = self._type(params)
-            elif action == "screenshot":
-                result = self._screenshot(params)
-            elif action == "get_text":
-                result = self._get_text(params)
-            elif action == "get_html":
-                result = self._get_html(params)
-            elif action == "evaluate":
-                result = self._evaluate(params)
-            elif action == "wait_for_selector":
-                result = self._wait_for_selector(params)
-            elif action == "wait_for_navigation":
-                result = self._wait_for_navigation(params)
-            elif action == "fill_form":
-                result = self._fill_form(params)
+        return result
+    
+    async def _run_action(self, action: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate an action's required parameters and dispatch it to its handler.
+        
+        Args:
+            action (str): Action name
+            params (Dict[str, Any]): Action parameters
+            
+        Returns:
+            Dict[str, Any]: Action result
+        """
+        handler = self._handlers.get(action) if isinstance(action, str) else None
+        
+        if handler is None:
+            return _err(f"Unknown action: {action}")
+        
+        for name, message, allow_empty in REQUIRED_PARAMS.get(action, ()):
+            value = params.get(name)
+            if value is None or not (value or allow_empty):
+                return _err(message)
+        
+        return await handler(params)
+    
+    async def _chain(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run several actions in one call and observe the resulting page.
+        
+        Steps are dispatched in-process, in order, and the chain stops at the first
+        failing step. Prefer this over separate calls for multi-step flows such as
+        login, navigate, click.
+        
+        Navigations without an explicit wait_until only wait for DOMContentLoaded when
+        another navigation or an action in DOM_READY_ACTIONS follows; the last one
+        otherwise waits for the load event.
+        
+        Args:
+            params (Dict[str, Any]): Parameters
+                - steps (List[Dict[str, Any]]): Actions to run, each with an "action" key
+                  and that action's parameters
+                - screenshot (bool, optional): Whether to include a screenshot in the
+                  observation. Defaults to False.
+            
+        Returns:
+            Dict[str, Any]: Result
+                - steps (List[Dict[str, Any]]): Per-step results
+                - observation (Dict[str, Any]): Final page URL and title, and screenshot if requested
+        """
+        steps = params.get("steps")
+        
+        results = []
+        error = None
+        
+        for index, step in enumerate(steps):
+            action = step.get("action")
+            
+            navigates = action == "goto" or (action == "click" and step.get("expect_navigation"))
+            if navigates and "wait_until" not in step:
+                later_actions = [later.get("action") for later in steps[index + 1:]]
+                if "goto" in later_actions or DOM_READY_ACTIONS.intersection(later_actions):
+                    step = dict(step, wait_until="domcontentloaded")
+            
+            if action == "chain":
+                step_result = _err("Chains cannot be nested")
             else:
-                result = {
-                    "status": "error",
-                    "error": f"Unknown action: {action}"
-                }
+                try:
+                    step_result = await self._run_action(action, step)
+                except Exception as e:
+                    step_result = _err(str(e), action=action)
             
-            self._set_result(result)
-            self._set_status("idle")
-            return result
+            results.append(step_result)
             
-        except Exception as e:
-            result = {
-                "status": "error",
-                "error": str(e),
-                "action": action
-            }
-            self._set_result(result)
-            self._set_status("idle")
-            return result
+            if step_result.get("status") != "success":
+                error = f"Step {index} ({action}) failed: {step_result.get('error')}"
+                break
+        
+        result = {
+            "status": "error" if error else "success",
+            "steps": results
+        }
+        
+        if error:
+            result["error"] = error
+        
+        if self.page:
+            # Let requests triggered by the last step settle briefly before observing
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=1500)
+            except Exception:
+                pass
+            
+            observation = dict(await self._page_snapshot())
+            
+            if params.get("screenshot"):
+                screenshot = await self._screenshot({})
+                if screenshot.get("status") == "success":
+                    observation["screenshot"] = screenshot["data"]
+            
+            result["observation"] = observation
+        
+        return result
     
-    def _open_browser(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _open_browser(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Open a browser.
+        Open a browser context for the current session.
+        
+        The browser itself is launched once and reused; each session gets a fresh
+        context, which is far cheaper than launching a new browser. With a user data
+        directory the session instead gets a persistent context in a browser of its
+        own, which keeps cookies and the HTTP cache across runs.
         
         Args:
             params (Dict[str, Any]): Parameters
                 - browser_type (str, optional): Browser type (chromium, firefox, webkit). Defaults to "chromium".
                 - headless (bool, optional): Whether to run in headless mode. Defaults to self.headless.
                 - user_data_dir (str, optional): Path to user data directory. Defaults to self.user_data_dir.
+                - block_resources (List[str], optional): Resource types to abort, e.g.
+                  ["image", "font", "media"]. Routing requests disables the HTTP cache of
+                  the context. Defaults to None.
+                - cache_dir (str, optional): Disk cache directory (Chromium only). Defaults to None.
+                - no_cache (bool, optional): Whether to disable the HTTP cache (Chromium only).
+                  Defaults to False.
+                - block_urls (List[str], optional): URL patterns to block, with "*" wildcards.
+                  Chromium matches them natively over CDP; other browsers use a route.
+                  Defaults to None.
+                - throttle (Dict[str, Any], optional): Network conditions for
+                  Network.emulateNetworkConditions, e.g. {"latency": 100,
+                  "downloadThroughput": 250000} (Chromium only). Defaults to None.
+                - persist_state (bool, optional): Whether to load cookies and local storage
+                  from state_path and save them back when the context closes, so logins
+                  survive across contexts and runs. Defaults to False.
+                - state_path (str, optional): Storage state file. Defaults to ".playwright_state.json".
             
         Returns:
             Dict[str, Any]: Result
@@ -144,49 +579,119 @@ class PlaywrightTool(Tool):
         browser_type = params.get("browser_type", "chromium")
         headless = params.get("headless", self.headless)
         user_data_dir = params.get("user_data_dir", self.user_data_dir)
+        block_resources = params.get("block_resources")
+        cache_dir = params.get("cache_dir")
+        no_cache = params.get("no_cache", False)
+        block_urls = params.get("block_urls")
+        throttle = params.get("throttle")
+        persist_state = params.get("persist_state", False)
+        state_path = params.get("state_path", DEFAULT_STATE_PATH)
         
-        # Close existing browser if open
-        if self.browser:
-            try:
-                self.browser.close()
-            except:
-                pass
-            self.browser = None
-            self.page = None
+        if browser_type not in ("chromium", "firefox", "webkit"):
+            return _err(f"Unknown browser type: {browser_type}")
         
-        # Launch browser
         browser_options = {
             "headless": headless
         }
         
+        if cache_dir and browser_type == "chromium":
+            browser_options["args"] = [
+                f"--disk-cache-dir={cache_dir}",
+                f"--disk-cache-size={DISK_CACHE_SIZE}"
+            ]
+        
+        # Replace the session's context if it already has one
+        await self._close_context(self._session_id)
+        
         if user_data_dir:
-            browser_options["user_data_dir"] = user_data_dir
-        
-        if browser_type == "chromium":
-            self.browser = self.playwright.chromium.launch(**browser_options)
-        elif browser_type == "firefox":
-            self.browser = self.playwright.firefox.launch(**browser_options)
-        elif browser_type == "webkit":
-            self.browser = self.playwright.webkit.launch(**browser_options)
+            context = await getattr(self.playwright, browser_type).launch_persistent_context(
+                user_data_dir, **browser_options
+            )
+            page = context.pages[0] if context.pages else await context.new_page()
         else:
-            return {
-                "status": "error",
-                "error": f"Unknown browser type: {browser_type}"
-            }
+            if self._browser_lock is None:
+                self._browser_lock = asyncio.Lock()
+            
+            # Sessions opening concurrently must not launch the browser twice
+            async with self._browser_lock:
+                # Each set of launch options gets its own browser, leaving other sessions' contexts open
+                launch_key = (browser_type, headless, cache_dir)
+                browser = self._browsers.get(launch_key)
+                if browser is not None and not browser.is_connected():
+                    # Crashed, or its window was closed by the user
+                    del self._browsers[launch_key]
+                    await _release_browser(launch_key, browser)
+                    browser = None
+                
+                if browser is None:
+                    browser = await _acquire_browser(launch_key, browser_type, browser_options)
+                    self._browsers[launch_key] = browser
+                
+                self.browser = browser
+                self.browser_type = browser_type
+                self._launch_key = launch_key
+                
+                context_options = {}
+                if persist_state and os.path.exists(state_path):
+                    context_options["storage_state"] = state_path
+                
+                context = await browser.new_context(**context_options)
+                self._session_keys[self._session_id] = launch_key
+            
+            page = await context.new_page()
+            
+            if persist_state:
+                self._state_paths[self._session_id] = state_path
+        
+        if block_resources:
+            await context.route("**/*", functools.partial(self._route_request, frozenset(block_resources)))
+        
+        if browser_type == "chromium" and (no_cache or block_urls or throttle):
+            # Applied in the browser itself, with no per-request callback into Python
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Network.enable")
+            
+            if no_cache:
+                await cdp.send("Network.setCacheDisabled", {"cacheDisabled": True})
+            
+            if block_urls:
+                await cdp.send("Network.setBlockedURLs", {"urls": list(block_urls)})
+            
+            if throttle:
+                await cdp.send("Network.emulateNetworkConditions", dict(NO_THROTTLE, **throttle))
+            
+            self._cdp_sessions[self._session_id] = cdp
+        else:
+            for pattern in block_urls or ():
+                await context.route(pattern, self._abort_route)
+            
+            if throttle:
+                logger.warning(f"Network throttling is only supported in Chromium, not {browser_type}")
+        
+        page.on("framenavigated", functools.partial(self._on_frame_navigated, self._session_id))
+        self._contexts[self._session_id] = context
+        self._pages[self._session_id] = page
         
-        # Create a new page
-        self.page = self.browser.new_page()
+        # Evict the least recently used contexts
+        while len(self._contexts) > self.max_contexts:
+            await self._close_context(next(iter(self._contexts)))
+        
+        await self._release_unused_browsers()
         
         return {
             "status": "success",
             "message": f"Opened {browser_type} browser",
             "browser_type": browser_type,
-            "headless": headless
+            "headless": headless,
+            "session_id": self._session_id
         }
     
-    def _close_browser(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _close_browser(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Close the browser.
+        Close the browser context of the current session.
+        
+        The shared browser stays running while other sessions use it, and is
+        released once its last context is closed.
         
         Args:
             params (Dict[str, Any]): Parameters
@@ -194,28 +699,117 @@ class PlaywrightTool(Tool):
         Returns:
             Dict[str, Any]: Result
         """
-        if not self.browser:
-            return {
-                "status": "error",
-                "error": "No browser is open"
-            }
+        if self._session_id not in self._contexts:
+            return _err("No browser is open")
+        
+        context = self._forget_session(self._session_id)
         
         try:
-            self.browser.close()
-            self.browser = None
-            self.page = None
+            await self._save_state(self._session_id, context)
+            await context.close()
             
             return {
                 "status": "success",
-                "message": "Closed browser"
+                "message": "Closed browser",
+                "session_id": self._session_id
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to close browser: {str(e)}"
-            }
+            return _err(f"Failed to close browser: {str(e)}")
+        finally:
+            self._state_paths.pop(self._session_id, None)
+            await self._release_unused_browsers()
     
-    def _goto(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _close_context(self, session_id: str) -> None:
+        """
+        Close a session's context, if it has one, ignoring errors.
+        
+        Args:
+            session_id (str): Session ID
+        """
+        context = self._forget_session(session_id)
+        
+        if context:
+            try:
+                await self._save_state(session_id, context)
+                await context.close()
+            except Exception as e:
+                logger.warning(f"Failed to close browser context {session_id}: {str(e)}")
+        
+        self._state_paths.pop(session_id, None)
+    
+    def _forget_session(self, session_id: str) -> Optional[Any]:
+        """
+        Drop a session's page and cached state.
+        
+        Args:
+            session_id (str): Session ID
+            
+        Returns:
+            Optional[Any]: The session's context, if it had one
+        """
+        self._pages.pop(session_id, None)
+        self._snapshots.pop(session_id, None)
+        self._screenshot_hashes.pop(session_id, None)
+        self._cdp_sessions.pop(session_id, None)
+        self._exposed.pop(session_id, None)
+        self._session_keys.pop(session_id, None)
+        return self._contexts.pop(session_id, None)
+    
+    async def _save_state(self, session_id: str, context: Any) -> None:
+        """
+        Save a session's cookies and local storage if it was opened with persist_state.
+        
+        Args:
+            session_id (str): Session ID
+            context (Any): The session's context
+        """
+        state_path = self._state_paths.get(session_id)
+        
+        if state_path:
+            await context.storage_state(path=state_path)
+    
+    async def _release_unused_browsers(self) -> None:
+        """Release the shared browsers that none of this tool's sessions has a context in."""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        
+        # Sessions register their launch options under the lock, before their context is set up
+        async with self._browser_lock:
+            in_use = set(self._session_keys.values())
+            
+            for launch_key, browser in list(self._browsers.items()):
+                if launch_key not in in_use:
+                    del self._browsers[launch_key]
+                    await _release_browser(launch_key, browser)
+                    
+                    if browser is self.browser:
+                        self.browser = None
+                        self.browser_type = None
+                        self._launch_key = None
+    
+    async def _route_request(self, blocked: frozenset, route: Any) -> None:
+        """
+        Abort requests for blocked resource types and continue the rest.
+        
+        Args:
+            blocked (frozenset): Resource types to abort
+            route (Any): Intercepted route
+        """
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _abort_route(self, route: Any) -> None:
+        """
+        Abort a routed request.
+        
+        Args:
+            route (Any): Intercepted route
+        """
+        await route.abort()
+    
+    async def _goto(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Navigate to a URL.
         
@@ -229,34 +823,41 @@ class PlaywrightTool(Tool):
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         url = params.get("url")
         wait_until = params.get("wait_until", "load")
         timeout = params.get("timeout", 30000)
         
-        if not url:
-            return {
-                "status": "error",
-                "error": "No URL provided"
-            }
-        
         try:
-            response = self.page.goto(url, wait_until=wait_until, timeout=timeout)
+            response = await self.page.goto(url, wait_until=wait_until, timeout=timeout)
+            
+            snapshot = await self._page_snapshot()
             
             return {
                 "status": "success",
-                "url": self.page.url,
-                "title": self.page.title(),
+                "url": snapshot["url"],
+                "title": snapshot["title"],
                 "status_code": response.status if response else None
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to navigate to {url}: {str(e)}"
-            }
+            return _err(f"Failed to navigate to {url}: {str(e)}")
+    
+    async def _fast_goto(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Navigate to a URL, returning as soon as the response is committed.
+        
+        Use this when the next action waits for what it needs itself.
+        
+        Args:
+            params (Dict[str, Any]): Parameters, as for goto (wait_until is ignored)
+            
+        Returns:
+            Dict[str, Any]: Result
+        """
+        return await self._goto(dict(params, wait_until="commit"))
     
-    def _click(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _click(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Click on an element.
         
@@ -267,24 +868,24 @@ class PlaywrightTool(Tool):
                 - position (Dict[str, int], optional): Click position (x, y). Defaults to None.
                 - delay (int, optional): Delay between mousedown and mouseup in milliseconds. Defaults to 0.
                 - timeout (int, optional): Timeout in milliseconds. Defaults to 30000.
+                - expect_navigation (bool, optional): Whether the click navigates. The wait for
+                  the navigation is set up before clicking, so both complete in one call.
+                  Defaults to False.
+                - wait_until (str, optional): When to consider the navigation complete. Defaults to "load".
+                - expected_url (str, optional): URL pattern the navigation must reach. Defaults to None.
             
         Returns:
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         selector = params.get("selector")
         button = params.get("button", "left")
         position = params.get("position")
         delay = params.get("delay", 0)
         timeout = params.get("timeout", 30000)
-        
-        if not selector:
-            return {
-                "status": "error",
-                "error": "No selector provided"
-            }
+        expect_navigation = params.get("expect_navigation", False)
         
         try:
             click_options = {
@@ -296,23 +897,41 @@ class PlaywrightTool(Tool):
             if position:
                 click_options["position"] = position
             
-            self.page.click(selector, **click_options)
+            if not expect_navigation:
+                await self.page.click(selector, **click_options)
+                
+                return {
+                    "status": "success",
+                    "message": f"Clicked on {selector}",
+                    "selector": selector
+                }
+            
+            async with self.page.expect_navigation(
+                url=params.get("expected_url"),
+                wait_until=params.get("wait_until", "load"),
+                timeout=timeout
+            ):
+                await self.page.click(selector, **click_options)
+            
+            snapshot = await self._page_snapshot()
             
             return {
                 "status": "success",
                 "message": f"Clicked on {selector}",
-                "selector": selector
+                "selector": selector,
+                "url": snapshot["url"],
+                "title": snapshot["title"]
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to click on {selector}: {str(e)}"
-            }
+            return _err(f"Failed to click on {selector}: {str(e)}")
     
-    def _type(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _type(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Type text into an element.
         
+        With no delay the element is filled in a single call, which is much faster
+        than typing key by key. A delay simulates human typing one key at a time.
+        
         Args:
             params (Dict[str, Any]): Parameters
                 - selector (str): Element selector
@@ -324,28 +943,22 @@ class PlaywrightTool(Tool):
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         selector = params.get("selector")
         text = params.get("text")
         delay = params.get("delay", 0)
         timeout = params.get("timeout", 30000)
         
-        if not selector:
-            return {
-                "status": "error",
-                "error": "No selector provided"
-            }
-        
-        if text is None:
-            return {
-                "status": "error",
-                "error": "No text provided"
-            }
-        
         try:
-            self.page.fill(selector, "", timeout=timeout)
-            self.page.type(selector, text, delay=delay, timeout=timeout)
+            if delay:
+                # Like page.fill, act on the first match rather than failing strict mode
+                locator = self.page.locator(selector).first
+                await locator.clear(timeout=timeout)
+                await locator.press_sequentially(text, delay=delay, timeout=timeout)
+            else:
+                # fill clears and sets the value in one round-trip
+                await self.page.fill(selector, text, timeout=timeout)
             
             return {
                 "status": "success",
@@ -354,12 +967,9 @@ class PlaywrightTool(Tool):
                 "text": text
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to type text into {selector}: {str(e)}"
-            }
+            return _err(f"Failed to type text into {selector}: {str(e)}")
     
-    def _screenshot(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _screenshot(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Take a screenshot.
         
@@ -367,60 +977,106 @@ class PlaywrightTool(Tool):
             params (Dict[str, Any]): Parameters
                 - path (str, optional): Path to save screenshot. Defaults to None.
                 - selector (str, optional): Element selector to screenshot. Defaults to None.
-                - full_page (bool, optional): Whether to take a full page screenshot. Defaults to False.
+                - full_page (bool, optional): Whether to take a full page screenshot. Full page
+                  shots scroll and stitch the page, so prefer the viewport. Defaults to False.
+                - type (str, optional): Image format, "jpeg" or "png". JPEG is several times
+                  smaller and faster to encode. Defaults to "png" for paths ending in .png,
+                  otherwise "jpeg".
+                - quality (int, optional): JPEG quality from 0 to 100. Defaults to 70.
+                - omit_background (bool, optional): Whether to make the default white
+                  background transparent (PNG only). Defaults to False.
+                - return_format (str, optional): How to return the image when no path is given:
+                  "base64", "bytes" (raw bytes, for in-process callers) or "path" (saved to a
+                  temporary file). Defaults to "base64".
+                - skip_unchanged (bool, optional): Whether to omit the image, returning
+                  unchanged=True, when it is identical to the session's previous screenshot.
+                  Defaults to False.
             
         Returns:
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         path = params.get("path")
         selector = params.get("selector")
         full_page = params.get("full_page", False)
+        return_format = params.get("return_format", "base64")
+        skip_unchanged = params.get("skip_unchanged", False)
+        image_type = params.get("type")
+        
+        if image_type is None:
+            image_type = "png" if path and path.lower().endswith(".png") else "jpeg"
+        
+        if image_type not in ("jpeg", "png"):
+            return _err(f"Unknown image type: {image_type}")
+        
+        if return_format not in ("base64", "bytes", "path"):
+            return _err(f"Unknown return format: {return_format}")
+        
+        if return_format == "path" and not path:
+            fd, path = tempfile.mkstemp(prefix="screenshot_", suffix=".jpg" if image_type == "jpeg" else ".png")
+            os.close(fd)
         
         try:
+            # Freeze animations and hide the caret so the capture does not wait on them
             screenshot_options = {
-                "full_page": full_page
+                "type": image_type,
+                "animations": "disabled",
+                "caret": "hide"
             }
             
+            if image_type == "jpeg":
+                screenshot_options["quality"] = params.get("quality", DEFAULT_JPEG_QUALITY)
+            elif params.get("omit_background"):
+                screenshot_options["omit_background"] = True
+            
             if path:
                 screenshot_options["path"] = path
             
             if selector:
                 # Take element screenshot
-                element = self.page.query_selector(selector)
+                element = await self.page.query_selector(selector)
                 if not element:
-                    return {
-                        "status": "error",
-                        "error": f"Element not found: {selector}"
-                    }
+                    return _err(f"Element not found: {selector}")
                 
-                screenshot = element.screenshot(**screenshot_options)
+                screenshot = await element.screenshot(**screenshot_options)
             else:
                 # Take page screenshot
-                screenshot = self.page.screenshot(**screenshot_options)
+                screenshot = await self.page.screenshot(full_page=full_page, **screenshot_options)
+            
+            if skip_unchanged:
+                digest = hashlib.sha256(screenshot).digest()
+                previous = self._screenshot_hashes.get(self._session_id)
+                self._screenshot_hashes[self._session_id] = digest
+                
+                if digest == previous:
+                    return {
+                        "status": "success",
+                        "message": "Screenshot unchanged",
+                        "unchanged": True
+                    }
             
             result = {
                 "status": "success",
-                "message": "Screenshot taken"
+                "message": "Screenshot taken",
+                "type": image_type
             }
             
             if path:
                 result["path"] = path
+            elif return_format == "bytes":
+                result["data"] = screenshot
+                result["encoding"] = "bytes"
             else:
-                import base64
                 result["data"] = base64.b64encode(screenshot).decode("ascii")
                 result["encoding"] = "base64"
             
             return result
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to take screenshot: {str(e)}"
-            }
+            return _err(f"Failed to take screenshot: {str(e)}")
     
-    def _get_text(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_text(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get text content of an element.
         
@@ -433,20 +1089,14 @@ class PlaywrightTool(Tool):
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         selector = params.get("selector")
         timeout = params.get("timeout", 30000)
         
-        if not selector:
-            return {
-                "status": "error",
-                "error": "No selector provided"
-            }
-        
         try:
-            self.page.wait_for_selector(selector, timeout=timeout)
-            text = self.page.text_content(selector)
+            # The locator waits for the element itself, so no separate wait is needed
+            text = await self.page.locator(selector).first.text_content(timeout=timeout)
             
             return {
                 "status": "success",
@@ -454,76 +1104,130 @@ class PlaywrightTool(Tool):
                 "text": text
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to get text from {selector}: {str(e)}"
-            }
+            return _err(f"Failed to get text from {selector}: {str(e)}")
     
-    def _get_html(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_html(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get HTML content of an element or page.
         
+        Without a selector only the scope's subtree is serialized, which is much
+        smaller than the whole document on large pages.
+        
         Args:
             params (Dict[str, Any]): Parameters
-                - selector (str, optional): Element selector. Defaults to None (whole page).
+                - selector (str, optional): Element selector whose inner HTML to get. Defaults to None.
+                - scope (str, optional): Without a selector, CSS selector of the element whose
+                  outer HTML to get (e.g. "body", "main", "head"), or "document" for the whole
+                  page. Defaults to "body".
+                - max_length (int, optional): Maximum number of characters to return. Defaults to None.
                 - timeout (int, optional): Timeout in milliseconds. Defaults to 30000.
             
         Returns:
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         selector = params.get("selector")
+        scope = params.get("scope", "body")
+        max_length = params.get("max_length")
         timeout = params.get("timeout", 30000)
         
         try:
             if selector:
-                self.page.wait_for_selector(selector, timeout=timeout)
-                html = self.page.inner_html(selector)
+                html = await self.page.locator(selector).first.inner_html(timeout=timeout)
+            elif scope == "document":
+                html = await self.page.content()
             else:
-                html = self.page.content()
+                html, truncated = await self.page.evaluate(SCOPED_HTML_JS, [scope, max_length])
+            
+            if selector or scope == "document":
+                truncated = bool(max_length) and len(html) > max_length
+                if truncated:
+                    html = html[:max_length]
             
             return {
                 "status": "success",
                 "selector": selector,
-                "html": html
+                "html": html,
+                "truncated": truncated
             }
         except Exception as e:
+            return _err(f"Failed to get HTML: {str(e)}")
+    
+    async def _get_many(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the text, HTML or an attribute of several elements in one call.
+        
+        All selectors are resolved by a single evaluate call, so prefer this over
+        repeated get_text calls. Elements are not waited for.
+        
+        Args:
+            params (Dict[str, Any]): Parameters
+                - selectors (Dict[str, str]): CSS selectors by result key
+                - kind (str, optional): What to read: "text", "html" or "attr". Defaults to "text".
+                - attribute (str, optional): Attribute name, required when kind is "attr"
+            
+        Returns:
+            Dict[str, Any]: Result
+                - values (Dict[str, Optional[str]]): Values by key, None for missing elements
+        """
+        if not self.page:
+            return await self._handle_no_page()
+        
+        selectors = params.get("selectors")
+        kind = params.get("kind", "text")
+        attribute = params.get("attribute")
+        
+        if kind not in ("text", "html", "attr"):
+            return _err(f"Unknown kind: {kind}")
+        
+        if kind == "attr" and not attribute:
+            return _err("No attribute provided")
+        
+        try:
+            values = await self.page.evaluate(GET_MANY_JS, [selectors, kind, attribute])
+            
             return {
-                "status": "error",
-                "error": f"Failed to get HTML: {str(e)}"
+                "status": "success",
+                "kind": kind,
+                "values": values
             }
+        except Exception as e:
+            return _err(f"Failed to get values: {str(e)}")
     
-    def _evaluate(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _evaluate(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate JavaScript code.
         
+        Expressions run repeatedly, e.g. across many pages, can be registered with
+        cache_as: the function is installed once per context and later calls only
+        send a short lookup instead of the full source.
+        
         Args:
             params (Dict[str, Any]): Parameters
                 - expression (str): JavaScript expression to evaluate
                 - arg (Any, optional): Argument to pass to the expression. Defaults to None.
+                - cache_as (str, optional): Name to register the expression under. The
+                  expression must then be a function taking the argument. Defaults to None.
             
         Returns:
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         expression = params.get("expression")
         arg = params.get("arg")
-        
-        if not expression:
-            return {
-                "status": "error",
-                "error": "No expression provided"
-            }
+        cache_as = params.get("cache_as")
         
         try:
-            if arg is not None:
-                result = self.page.evaluate(expression, arg)
+            if cache_as:
+                result = await self.page.evaluate(await self._expose_cached(cache_as, expression), arg)
+            elif arg is not None:
+                result = await self.page.evaluate(expression, arg)
             else:
-                result = self.page.evaluate(expression)
+                result = await self.page.evaluate(expression)
             
             return {
                 "status": "success",
@@ -531,12 +1235,33 @@ class PlaywrightTool(Tool):
                 "result": result
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to evaluate expression: {str(e)}"
-            }
+            return _err(f"Failed to evaluate expression: {str(e)}")
+    
+    async def _expose_cached(self, name: str, body: str) -> str:
+        """
+        Install a function in the current session's pages, once per source.
+        
+        Args:
+            name (str): Name to register the function under
+            body (str): JavaScript function source
+            
+        Returns:
+            str: Short expression that calls the installed function with its argument
+        """
+        key = json.dumps(name)
+        exposed = self._exposed.setdefault(self._session_id, {})
+        
+        if exposed.get(name) != body:
+            script = f"(window.__tools = window.__tools || {{}})[{key}] = ({body})"
+            
+            # The init script covers later documents; the current one is updated directly
+            await self._contexts[self._session_id].add_init_script(script)
+            await self.page.evaluate(script)
+            exposed[name] = body
+        
+        return f"(arg) => window.__tools[{key}](arg)"
     
-    def _wait_for_selector(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _wait_for_selector(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Wait for an element to appear.
         
@@ -550,20 +1275,14 @@ class PlaywrightTool(Tool):
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         selector = params.get("selector")
         state = params.get("state", "visible")
         timeout = params.get("timeout", 30000)
         
-        if not selector:
-            return {
-                "status": "error",
-                "error": "No selector provided"
-            }
-        
         try:
-            element = self.page.wait_for_selector(selector, state=state, timeout=timeout)
+            element = await self.page.wait_for_selector(selector, state=state, timeout=timeout)
             
             if element:
                 return {
@@ -573,20 +1292,16 @@ class PlaywrightTool(Tool):
                     "state": state
                 }
             else:
-                return {
-                    "status": "error",
-                    "error": f"Element {selector} not found"
-                }
+                return _err(f"Element {selector} not found")
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to wait for selector {selector}: {str(e)}"
-            }
+            return _err(f"Failed to wait for selector {selector}: {str(e)}")
     
-    def _wait_for_navigation(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _wait_for_navigation(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Wait for navigation to complete.
         
+        The navigation may already be in flight, e.g. started by a previous click.
+        
         Args:
             params (Dict[str, Any]): Parameters
                 - url (str, optional): URL to wait for. Defaults to None.
@@ -597,36 +1312,37 @@ class PlaywrightTool(Tool):
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         url = params.get("url")
         wait_until = params.get("wait_until", "load")
         timeout = params.get("timeout", 30000)
         
         try:
-            with self.page.expect_navigation(url=url, wait_until=wait_until, timeout=timeout) as navigation_info:
-                # This will wait for navigation to complete
-                pass
+            if url:
+                await self.page.wait_for_url(url, wait_until=wait_until, timeout=timeout)
+            elif wait_until != "commit":
+                await self.page.wait_for_load_state(wait_until, timeout=timeout)
             
-            response = navigation_info.value
+            snapshot = await self._page_snapshot()
             
             return {
                 "status": "success",
                 "message": "Navigation complete",
-                "url": self.page.url,
-                "title": self.page.title(),
-                "status_code": response.status if response else None
+                "url": snapshot["url"],
+                "title": snapshot["title"]
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to wait for navigation: {str(e)}"
-            }
+            return _err(f"Failed to wait for navigation: {str(e)}")
     
-    def _fill_form(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _fill_form(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Fill a form with multiple fields.
         
+        Text fields already in the page are filled together with a single evaluate
+        call; other fields (e.g. not yet rendered, or non-CSS selectors) fall back
+        to page.fill.
+        
         Args:
             params (Dict[str, Any]): Parameters
                 - form_data (Dict[str, str]): Form data (selector -> value)
@@ -637,26 +1353,21 @@ class PlaywrightTool(Tool):
             Dict[str, Any]: Result
         """
         if not self.page:
-            return self._handle_no_page()
+            return await self._handle_no_page()
         
         form_data = params.get("form_data")
         submit_selector = params.get("submit_selector")
         timeout = params.get("timeout", 30000)
         
-        if not form_data:
-            return {
-                "status": "error",
-                "error": "No form data provided"
-            }
-        
         try:
-            # Fill each field
-            for selector, value in form_data.items():
-                self.page.fill(selector, value, timeout=timeout)
+            # Fill all fields present in the DOM at once, then the rest one by one
+            missing = await self.page.evaluate(FILL_FORM_JS, form_data)
+            for selector in missing:
+                await self.page.fill(selector, form_data[selector], timeout=timeout)
             
             # Submit form if requested
             if submit_selector:
-                self.page.click(submit_selector, timeout=timeout)
+                await self.page.click(submit_selector, timeout=timeout)
             
             return {
                 "status": "success",
@@ -665,37 +1376,46 @@ class PlaywrightTool(Tool):
                 "submitted": bool(submit_selector)
             }
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"Failed to fill form: {str(e)}"
-            }
+            return _err(f"Failed to fill form: {str(e)}")
     
-    def _handle_no_page(self) -> Dict[str, Any]:
+    async def _page_snapshot(self) -> Dict[str, str]:
         """
-        Handle the case when no page is open.
+        Get the URL and title of the current page with one evaluate call.
+        
+        The result is cached until the page navigates or the next action starts.
         
         Returns:
-            Dict[str, Any]: Error result
+            Dict[str, str]: Page URL and title
         """
-        # Try to open a browser if none is open
-        if not self.browser:
-            try:
-                return self._open_browser({})
-            except Exception as e:
-                return {
-                    "status": "error",
-                    "error": f"No browser is open and failed to open one: {str(e)}"
-                }
+        snapshot = self._snapshots.get(self._session_id)
+        
+        if snapshot is None:
+            snapshot = await self.page.evaluate(PAGE_SNAPSHOT_JS)
+            self._snapshots[self._session_id] = snapshot
+        
+        return snapshot
+    
+    def _on_frame_navigated(self, session_id: str, frame: Any) -> None:
+        """
+        Drop a session's cached page snapshot when its main frame navigates.
+        
+        Args:
+            session_id (str): Session ID
+            frame (Any): Navigated frame
+        """
+        if frame.parent_frame is None:
+            self._snapshots.pop(session_id, None)
+            self._screenshot_hashes.pop(session_id, None)
+    
+    async def _handle_no_page(self) -> Dict[str, Any]:
+        """
+        Handle the case when no page is open.
         
-        # Try to open a new page
+        Returns:
+            Dict[str, Any]: Result of opening a context for the current session
+        """
+        # Open a context for this session, launching the browser if none is running
         try:
-            self.page = self.browser.new_page()
-            return {
-                "status": "success",
-                "message": "Opened new page"
-            }
+            return await self._open_browser({})
         except Exception as e:
-            return {
-                "status": "error",
-                "error": f"No page is open and failed to open one: {str(e)}"
-            }
+            return _err(f"No page is open and failed to open one: {str(e)}")
@@ -4,22 +4,742 @@ Python Executor Tool for Autobot.
 Executes Python code snippets or scripts.
 """
 
+import io
 import os
+import ast
 import sys
+import math
+import pickle
+import builtins
 import logging
-import tempfile
+import threading
 import traceback
-from io import StringIO
-from typing import Dict, Any, List, Optional
+import functools
+import subprocess
+from collections import OrderedDict
+from types import CodeType, FunctionType
+from contextvars import ContextVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from autobot.tools.base import Tool
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Filename reported in tracebacks of snippets that are not saved to a file
+SNIPPET_FILENAME = "<autobot>"
+
+# Script run by each pooled worker process
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "python_worker.py")
+
+# Modules imported once per worker so snippets don't pay for them; missing ones are skipped
+PRELOAD_MODULES = ("json", "re", "math", "collections", "numpy", "requests", "bs4")
+
+# Name under which the JIT decorator is injected into the globals of in-process snippets
+JIT_DECORATOR_NAME = "__autobot_jit__"
+
+# Statement and expression types allowed in a function considered for JIT compilation
+JIT_NODE_TYPES = (
+    ast.Assign, ast.AugAssign, ast.For, ast.While, ast.If, ast.Return, ast.Break, ast.Continue, ast.Pass,
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Name, ast.Constant,
+    ast.Subscript, ast.Slice, ast.Tuple, ast.Call, ast.Attribute,
+    ast.operator, ast.unaryop, ast.boolop, ast.cmpop, ast.expr_context, ast.arguments, ast.arg
+)
+
+# Builtins a JIT-compiled function may call
+JIT_BUILTINS = frozenset(["range", "abs", "min", "max", "len", "int", "float", "bool", "round"])
+
+# math functions a JIT-compiled function may call: those returning a float for every
+# float input, including inf and nan. The rest raise ValueError or OverflowError in
+# Python (sqrt(-1.0), log(0.0), exp(1000.0), sin(inf)) where Numba returns nan or inf.
+JIT_MATH_FUNCS = frozenset(["fabs", "copysign", "hypot", "atan", "atan2", "tanh", "erf", "erfc"])
+
+# math constants a JIT-compiled function may use
+JIT_MATH_CONSTANTS = frozenset(["pi", "e", "tau", "inf", "nan"])
+
+# Integer operators whose result never exceeds their operands, so they can't overflow
+JIT_BOUNDED_INT_OPS = (ast.Mod, ast.FloorDiv, ast.BitAnd, ast.RShift)
+
+# Maximum number of compiled functions kept across snippets
+JIT_CACHE_SIZE = 64
+
+# Compiled functions by source, shared across snippets (LRU order)
+_JIT_CACHE: "OrderedDict[str, _JitCompilation]" = OrderedDict()
+_jit_lock = threading.Lock()
+
+# Single background thread compiling functions so callers never wait on Numba
+_jit_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autobot-jit")
+
+def _is_float_type(numba_type) -> bool:
+    """
+    Check whether a Numba type is a float or complex scalar, or an array of them.
+    
+    Args:
+        numba_type: Type returned by numba.typeof
+        
+    Returns:
+        bool: Whether values of this type are floating point
+    """
+    if isinstance(numba_type, numba.types.Array):
+        numba_type = numba_type.dtype
+    return isinstance(numba_type, (numba.types.Float, numba.types.Complex))
+
+class _JitCompilation:
+    """
+    Numba compilations of one function source, shared by every snippet defining it.
+    
+    The function is compiled against the real math module and builtins rather than
+    the globals of the snippet that happened to define it first.
+    
+    Only calls whose value arguments are floats (or float arrays) and whose
+    other arguments are plain numbers are compiled: integer arithmetic wraps
+    around in Numba but not in Python.
+    """
+    
+    def __init__(self, func, cache: bool, float_args: Tuple[str, ...]):
+        """
+        Prepare a function for lazy JIT compilation.
+        
+        Args:
+            func: Python function
+            cache (bool): Whether Numba may cache the machine code on disk
+            float_args (Tuple[str, ...]): Arguments used in arithmetic, which must be floats
+        """
+        code = func.__code__
+        clean_func = FunctionType(code, {"math": math, "__builtins__": builtins}, func.__name__)
+        self.dispatcher = numba.njit(cache=cache)(clean_func)
+        
+        self._float_positions = [name in float_args for name in code.co_varnames[:code.co_argcount]]
+        
+        # Background compilations by argument signature
+        self._compilations: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+    
+    def _signature(self, args: tuple) -> Optional[Tuple]:
+        """
+        Get the Numba signature of a call, if it is safe to compile.
+        
+        Args:
+            args (tuple): Positional arguments
+            
+        Returns:
+            Optional[Tuple]: Argument types, or None if the call must be interpreted
+        """
+        if len(args) != len(self._float_positions):
+            return None
+        
+        try:
+            signature = tuple(numba.typeof(arg) for arg in args)
+        except ValueError:
+            # An argument type Numba doesn't know
+            return None
+        
+        for numba_type, must_be_float in zip(signature, self._float_positions):
+            if must_be_float:
+                if not _is_float_type(numba_type):
+                    return None
+            elif not isinstance(numba_type, (numba.types.Integer, numba.types.Float)):
+                return None
+        
+        return signature
+    
+    def ready(self, args: tuple) -> bool:
+        """
+        Check whether a call can run compiled, queueing its compilation on first sight.
+        
+        Args:
+            args (tuple): Positional arguments
+            
+        Returns:
+            bool: Whether the compiled function can be called with these arguments
+        """
+        dispatcher = self.dispatcher
+        signature = self._signature(args) if dispatcher is not None else None
+        if signature is None:
+            return False
+        
+        with self._lock:
+            future = self._compilations.get(signature)
+            if future is None:
+                self._compilations[signature] = _jit_executor.submit(dispatcher.compile, signature)
+        
+        if future is None or not future.done():
+            return False
+        
+        try:
+            future.result()
+            return True
+        except numba.core.errors.NumbaError as e:
+            # Types Numba can't handle; keep interpreting this function from now on
+            logger.debug(f"JIT compilation of {dispatcher.py_func.__name__} failed: {str(e)}")
+            self.dispatcher = None
+            return False
+
+class _JitFunction:
+    """
+    Function that runs interpreted until its Numba-compiled machine code is ready.
+    
+    The first call with a given argument signature queues compilation on a
+    background thread and runs the Python function; later calls switch to the
+    compiled version once it is done. If compilation fails the function keeps
+    running interpreted. Calls are only compiled while the snippet's own math
+    name is the math module the shared compilation was built against.
+    """
+    
+    def __init__(self, func, compilation: _JitCompilation):
+        """
+        Wrap a function defined by a snippet.
+        
+        Args:
+            func: Python function, bound to the snippet's globals
+            compilation (_JitCompilation): Shared compilations of the function's source
+        """
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.compilation = compilation
+        self._uses_math = "math" in func.__code__.co_names
+    
+    def __call__(self, *args, **kwargs):
+        """Call the compiled function if it is ready, otherwise the Python one."""
+        if (not kwargs and (not self._uses_math or self.func.__globals__.get("math") is math)
+                and self.compilation.ready(args)):
+            return self.compilation.dispatcher(*args)
+        
+        return self.func(*args, **kwargs)
+
+def _jit(key: str, cache: bool, float_args: Tuple[str, ...]):
+    """
+    Build the decorator applied to functions selected for JIT compilation.
+    
+    Args:
+        key (str): Function source, identifying earlier compilations of the same function
+        cache (bool): Whether Numba may cache the machine code on disk
+        float_args (Tuple[str, ...]): Arguments used in arithmetic, which must be floats
+        
+    Returns:
+        Callable: Decorator wrapping the function around the shared compilations
+    """
+    def decorate(func):
+        with _jit_lock:
+            compilation = _JIT_CACHE.get(key)
+            if compilation is None:
+                compilation = _JIT_CACHE[key] = _JitCompilation(func, cache, float_args)
+            _JIT_CACHE.move_to_end(key)
+            
+            while len(_JIT_CACHE) > JIT_CACHE_SIZE:
+                _JIT_CACHE.popitem(last=False)
+        
+        return _JitFunction(func, compilation)
+    
+    return decorate
+
+class _FloatLoopChecker:
+    """
+    Decide whether a function's arithmetic is all floating point.
+    
+    Numba compiles integers to 64 bits, where Python's are unbounded, so a loop
+    such as a factorial would silently give a different result when compiled.
+    A function qualifies only if every arithmetic result outside of indexing
+    is a float (or an integer operation that can't grow, like %).
+    """
+    
+    def __init__(self, node: ast.FunctionDef):
+        """
+        Initialize the checker.
+        
+        Args:
+            node (ast.FunctionDef): Function definition
+        """
+        self.node = node
+        self.arg_names = [arg.arg for arg in node.args.args]
+        self.value_args: set = set()
+        self.float_names: set = set()
+    
+    def is_float(self, expr: ast.expr) -> bool:
+        """
+        Check whether an expression always evaluates to a float.
+        
+        Args:
+            expr (ast.expr): Expression
+            
+        Returns:
+            bool: Whether the expression is floating point
+        """
+        if isinstance(expr, ast.Constant):
+            return isinstance(expr.value, (float, complex))
+        if isinstance(expr, ast.Name):
+            return expr.id in self.float_names or expr.id in self.value_args
+        if isinstance(expr, ast.Subscript):
+            # Elements of argument arrays, which are required to be float arrays
+            return isinstance(expr.value, ast.Name) and expr.value.id in self.value_args
+        if isinstance(expr, ast.BinOp):
+            return isinstance(expr.op, ast.Div) or self.is_float(expr.left) or self.is_float(expr.right)
+        if isinstance(expr, ast.UnaryOp):
+            return self.is_float(expr.operand)
+        if isinstance(expr, ast.IfExp):
+            return self.is_float(expr.body) and self.is_float(expr.orelse)
+        if isinstance(expr, ast.Attribute):
+            return expr.attr in JIT_MATH_CONSTANTS
+        if isinstance(expr, ast.Call):
+            func = expr.func
+            if isinstance(func, ast.Attribute):
+                return func.attr in JIT_MATH_FUNCS
+            if func.id == "float":
+                return True
+            if func.id in ("abs", "min", "max"):
+                return any(self.is_float(arg) for arg in expr.args)
+        return False
+    
+    def _find_value_args(self, expr: ast.AST, index: bool) -> None:
+        """
+        Record arguments used outside indexing and comparisons.
+        
+        Args:
+            expr (ast.AST): Node to scan
+            index (bool): Whether the node is an index, a range() bound or a comparison operand
+        """
+        if isinstance(expr, ast.Name):
+            if not index and expr.id in self.arg_names:
+                self.value_args.add(expr.id)
+        elif isinstance(expr, ast.Subscript):
+            # Indexed arguments are arrays whose elements feed the arithmetic
+            if isinstance(expr.value, ast.Name) and expr.value.id in self.arg_names:
+                self.value_args.add(expr.value.id)
+            else:
+                self._find_value_args(expr.value, index)
+            self._find_value_args(expr.slice, True)
+        elif isinstance(expr, ast.Call) and isinstance(expr.func, ast.Name) and expr.func.id in ("range", "len"):
+            for arg in expr.args:
+                self._find_value_args(arg, True)
+        elif isinstance(expr, ast.Compare):
+            for operand in [expr.left] + expr.comparators:
+                self._find_value_args(operand, True)
+        else:
+            for child in ast.iter_child_nodes(expr):
+                self._find_value_args(child, index)
+    
+    def _arithmetic_is_safe(self, expr: ast.AST, index: bool) -> bool:
+        """
+        Check that no integer arithmetic outside indexing could overflow.
+        
+        Args:
+            expr (ast.AST): Node to check
+            index (bool): Whether the node is an index or a range() bound
+            
+        Returns:
+            bool: Whether every arithmetic result is safe
+        """
+        if isinstance(expr, ast.BinOp) and not index:
+            if not self.is_float(expr) and not isinstance(expr.op, JIT_BOUNDED_INT_OPS):
+                return False
+        elif isinstance(expr, ast.AugAssign):
+            target = expr.target
+            if isinstance(target, ast.Name):
+                if target.id not in self.float_names and not isinstance(expr.op, JIT_BOUNDED_INT_OPS):
+                    return False
+            elif not self.is_float(target):
+                return False
+        elif isinstance(expr, ast.Subscript):
+            return self._arithmetic_is_safe(expr.value, index) and self._arithmetic_is_safe(expr.slice, True)
+        elif isinstance(expr, ast.Call) and isinstance(expr.func, ast.Name) and expr.func.id == "range":
+            return all(self._arithmetic_is_safe(arg, True) for arg in expr.args)
+        elif isinstance(expr, ast.Call) and isinstance(expr.func, ast.Name) and expr.func.id in ("int", "round"):
+            # Python raises for nan and inf, Numba returns an arbitrary integer
+            if any(self.is_float(arg) for arg in expr.args):
+                return False
+        
+        return all(self._arithmetic_is_safe(child, index) for child in ast.iter_child_nodes(expr))
+    
+    def check(self) -> Optional[Tuple[str, ...]]:
+        """
+        Check the function.
+        
+        Returns:
+            Optional[Tuple[str, ...]]: Arguments that must be floats at call time, or None if
+                the function has integer arithmetic that could overflow
+        """
+        for stmt in self.node.body:
+            self._find_value_args(stmt, False)
+        
+        # Locals are floats if every assignment to them is, which may depend on other locals
+        assignments: Dict[str, List[ast.expr]] = {}
+        loop_targets = set()
+        for stmt in self.node.body:
+            for child in ast.walk(stmt):
+                if isinstance(child, ast.Assign):
+                    for target in child.targets:
+                        if isinstance(target, ast.Name):
+                            assignments.setdefault(target.id, []).append(child.value)
+                        elif not isinstance(target, ast.Subscript):
+                            return None
+                elif isinstance(child, ast.For):
+                    if not isinstance(child.target, ast.Name):
+                        return None
+                    loop_targets.add(child.target.id)
+        
+        changed = True
+        while changed:
+            changed = False
+            for name, values in assignments.items():
+                if name not in self.float_names and name not in loop_targets and name not in self.arg_names:
+                    if all(self.is_float(value) for value in values):
+                        self.float_names.add(name)
+                        changed = True
+        
+        if not all(self._arithmetic_is_safe(stmt, False) for stmt in self.node.body):
+            return None
+        
+        return tuple(name for name in self.arg_names if name in self.value_args)
+
+def _jit_float_args(node: ast.FunctionDef) -> Optional[Tuple[str, ...]]:
+    """
+    Check whether a function is a plain floating-point loop that Numba can compile.
+    
+    The function must loop over range() and only use its arguments, its own
+    locals, a few builtins and the math functions in JIT_MATH_FUNCS. Its arithmetic
+    must be floating point, checked by _FloatLoopChecker, because Numba's 64-bit
+    integers would silently overflow where Python's don't. Anything where Numba
+    returns nan or inf instead of raising like Python (**, most math functions,
+    int() of a float) is rejected, so compiling never changes a result.
+    
+    Args:
+        node (ast.FunctionDef): Function definition
+        
+    Returns:
+        Optional[Tuple[str, ...]]: Arguments that must be floats (or float arrays) for a call
+            to be compiled, or None if the function should not be JIT-compiled
+    """
+    args = node.args
+    if (node.decorator_list or node.returns or args.vararg or args.kwarg or args.kwonlyargs
+            or args.posonlyargs or args.defaults):
+        return None
+    
+    local_names = {arg.arg for arg in args.args}
+    has_range_loop = False
+    
+    for stmt in node.body:
+        for child in ast.walk(stmt):
+            if not isinstance(child, JIT_NODE_TYPES):
+                return None
+            
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+                local_names.add(child.id)
+            elif isinstance(child, ast.Constant) and not isinstance(child.value, (int, float, complex)):
+                return None
+            elif isinstance(child, ast.Attribute):
+                if not (isinstance(child.value, ast.Name) and child.value.id == "math"
+                        and (child.attr in JIT_MATH_FUNCS or child.attr in JIT_MATH_CONSTANTS)):
+                    return None
+            elif isinstance(child, ast.Pow):
+                # Python raises or returns a complex for a negative base and fractional
+                # exponent, where Numba returns nan
+                return None
+            elif isinstance(child, ast.Call):
+                if child.keywords or not isinstance(child.func, (ast.Name, ast.Attribute)):
+                    return None
+                if isinstance(child.func, ast.Name) and child.func.id not in JIT_BUILTINS:
+                    return None
+            elif isinstance(child, ast.For):
+                if isinstance(child.iter, ast.Call) and isinstance(child.iter.func, ast.Name) and child.iter.func.id == "range":
+                    has_range_loop = True
+    
+    if not has_range_loop:
+        return None
+    
+    # Every other name must be a local, or the function could depend on mutable globals
+    for stmt in node.body:
+        for child in ast.walk(stmt):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+                if child.id not in local_names and child.id not in JIT_BUILTINS and child.id != "math":
+                    return None
+    
+    return _FloatLoopChecker(node).check()
+
+def _add_jit_decorators(tree: ast.Module, cache: bool) -> None:
+    """
+    Decorate top-level floating-point loop functions so they are JIT-compiled with Numba.
+    
+    Args:
+        tree (ast.Module): Parsed snippet, modified in place
+        cache (bool): Whether Numba may cache the machine code on disk
+    """
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        
+        float_args = _jit_float_args(node)
+        if float_args is not None:
+            decorator = ast.Call(
+                func=ast.Name(id=JIT_DECORATOR_NAME, ctx=ast.Load()),
+                args=[
+                    ast.Constant(value=ast.unparse(node)),
+                    ast.Constant(value=cache),
+                    ast.Tuple(elts=[ast.Constant(value=name) for name in float_args], ctx=ast.Load())
+                ],
+                keywords=[]
+            )
+            node.decorator_list.append(ast.copy_location(decorator, node))
+    
+    ast.fix_missing_locations(tree)
+
+@functools.lru_cache(maxsize=128)
+def _compile_code(code: str, filename: str) -> Union[CodeType, SyntaxError]:
+    """
+    Compile source code, caching the result so repeated snippets are not re-parsed.
+    
+    Syntax errors are cached too, so repeatedly submitted bad snippets are not
+    re-parsed either. When Numba is installed, top-level functions that are plain
+    floating-point loops are decorated to be JIT-compiled in the background; see
+    _jit_float_args and _JitFunction.
+    
+    Args:
+        code (str): Python source
+        filename (str): Filename reported in tracebacks
+        
+    Returns:
+        Union[CodeType, SyntaxError]: Code object, or the SyntaxError raised by compile
+    """
+    try:
+        if not NUMBA_AVAILABLE:
+            return compile(code, filename, "exec")
+        
+        tree = ast.parse(code, filename)
+        # Numba can only cache functions whose source lives in a real file
+        _add_jit_decorators(tree, cache=filename != SNIPPET_FILENAME)
+        return compile(tree, filename, "exec")
+    except SyntaxError as e:
+        return e
+
+class _ListSink(io.TextIOBase):
+    """Text stream that collects writes in a list and joins them on demand."""
+    
+    def __init__(self):
+        """Initialize an empty sink."""
+        super().__init__()
+        self._parts: List[str] = []
+    
+    def writable(self) -> bool:
+        """Report that the sink accepts writes."""
+        return True
+    
+    def write(self, s: str) -> int:
+        """
+        Append text to the sink.
+        
+        Args:
+            s (str): Text to write
+            
+        Returns:
+            int: Number of characters written
+        """
+        self._parts.append(s)
+        return len(s)
+    
+    def getvalue(self) -> str:
+        """
+        Get everything written so far.
+        
+        Returns:
+            str: Collected text
+        """
+        return "".join(self._parts)
+
+class _StreamRouter:
+    """
+    Stand-in for sys.stdout/sys.stderr that sends writes to the current context's sink.
+    
+    Threads started by a snippet are given its sinks by _start_thread; writes from
+    any other context without a sink go to the wrapped stream.
+    """
+    
+    def __init__(self, stream, sink_var: ContextVar):
+        """
+        Initialize the router.
+        
+        Args:
+            stream: Stream written to when no sink is set
+            sink_var (ContextVar): Context variable holding the current sink
+        """
+        self._stream = stream
+        self._sink_var = sink_var
+    
+    def _target(self):
+        """Get the sink or stream that writes should go to."""
+        sink = self._sink_var.get()
+        return self._stream if sink is None else sink
+    
+    def write(self, s: str) -> int:
+        """Write text to the current sink, or to the wrapped stream."""
+        return self._target().write(s)
+    
+    def writelines(self, lines) -> None:
+        """Write lines to the current sink, or to the wrapped stream."""
+        self._target().writelines(lines)
+    
+    def flush(self) -> None:
+        """Flush the current sink, or the wrapped stream."""
+        self._target().flush()
+    
+    def __getattr__(self, name: str):
+        """Delegate other attributes (encoding, fileno, ...) to the wrapped stream."""
+        return getattr(self._stream, name)
+
+# Sinks capturing output of the in-process snippet running in the current context
+_stdout_sink: ContextVar[Optional[_ListSink]] = ContextVar("autobot_stdout_sink", default=None)
+_stderr_sink: ContextVar[Optional[_ListSink]] = ContextVar("autobot_stderr_sink", default=None)
+
+# Thread.start before _start_thread replaced it
+_thread_start = threading.Thread.start
+
+def _start_thread(thread: threading.Thread) -> None:
+    """
+    Start a thread, handing it the output sinks of the context starting it.
+    
+    New threads don't inherit context variables, so without this a thread started
+    by a snippet would print to the console instead of the snippet's output.
+    
+    Args:
+        thread (threading.Thread): Thread to start
+    """
+    stdout_sink = _stdout_sink.get()
+    stderr_sink = _stderr_sink.get()
+    
+    if stdout_sink is not None or stderr_sink is not None:
+        run = thread.run
+        
+        def run_with_sinks():
+            _stdout_sink.set(stdout_sink)
+            _stderr_sink.set(stderr_sink)
+            run()
+        
+        thread.run = run_with_sinks
+    
+    _thread_start(thread)
+
+def _install_stream_routers() -> None:
+    """Route sys.stdout and sys.stderr through the per-context sinks, once."""
+    if not isinstance(sys.stdout, _StreamRouter):
+        sys.stdout = _StreamRouter(sys.stdout, _stdout_sink)
+    if not isinstance(sys.stderr, _StreamRouter):
+        sys.stderr = _StreamRouter(sys.stderr, _stderr_sink)
+    
+    threading.Thread.start = _start_thread
+
+class PythonWorkerPool:
+    """
+    Pool of pre-warmed Python worker processes that run code snippets.
+    
+    Each worker runs a single snippet and exits, so no module, environment or
+    sys.path change leaks from one snippet to the next; a fresh worker is started
+    in its place while the caller handles the result.
+    """
+    
+    def __init__(self, max_workers: int = 2, preload: tuple = PRELOAD_MODULES):
+        """
+        Initialize the worker pool. Workers are started on demand.
+        
+        Args:
+            max_workers (int, optional): Maximum number of concurrent workers. Defaults to 2.
+            preload (tuple, optional): Modules each worker imports at startup. Defaults to PRELOAD_MODULES.
+        """
+        self.preload = preload
+        self._idle: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        
+        # Keep one worker warm so the first snippet doesn't pay for startup
+        self._idle.append(self._spawn())
+    
+    def _spawn(self) -> subprocess.Popen:
+        """
+        Start a worker process.
+        
+        Returns:
+            subprocess.Popen: Worker process
+        """
+        return subprocess.Popen(
+            [sys.executable, WORKER_SCRIPT, *self.preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+    
+    def submit(self, code: str, timeout: float, working_dir: Optional[str] = None, filename: str = SNIPPET_FILENAME) -> Dict[str, Any]:
+        """
+        Run code in an idle worker and wait for it to finish.
+        
+        Args:
+            code (str): Python code to execute
+            timeout (float): Timeout in seconds; the worker is killed when it expires
+            working_dir (str, optional): Working directory. Defaults to None.
+            filename (str, optional): Filename reported in tracebacks. Defaults to SNIPPET_FILENAME.
+            
+        Returns:
+            Dict[str, Any]: Exit code and captured stdout and stderr bytes
+            
+        Raises:
+            TimeoutError: If the code did not finish within the timeout
+            RuntimeError: If the worker died without returning a result
+        """
+        with self._slots:
+            with self._lock:
+                worker = None
+                while self._idle and worker is None:
+                    worker = self._idle.pop()
+                    if worker.poll() is not None:
+                        worker = None
+            
+            if worker is None:
+                worker = self._spawn()
+            
+            timed_out = threading.Event()
+            
+            def kill():
+                timed_out.set()
+                worker.kill()
+            
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            
+            try:
+                pickle.dump({"code": code, "filename": filename, "working_dir": working_dir}, worker.stdin)
+                worker.stdin.flush()
+                result = pickle.load(worker.stdout)
+            except (EOFError, OSError, pickle.UnpicklingError):
+                worker.kill()
+                worker.wait()
+                if timed_out.is_set():
+                    raise TimeoutError(f"Execution timed out after {timeout} seconds")
+                raise RuntimeError(f"Worker exited unexpectedly with code {worker.returncode}")
+            finally:
+                timer.cancel()
+            
+            if timed_out.is_set():
+                worker.kill()
+                worker.wait()
+            
+            # The worker exits by itself after one job; start its replacement now
+            worker.stdin.close()
+            worker.stdout.close()
+            replacement = self._spawn()
+            with self._lock:
+                self._idle.append(replacement)
+            
+            return result
+
 class PythonExecutorTool(Tool):
     """Tool for executing Python code."""
     
+    # Worker pool shared by all executors, started on first subprocess run
+    _pool: Optional[PythonWorkerPool] = None
+    _pool_lock = threading.Lock()
+    
     def __init__(self, working_dir: str = None):
         """
         Initialize the Python executor tool.
@@ -46,8 +766,10 @@ class PythonExecutorTool(Tool):
                 - save_to_file (bool, optional): Whether to save code to a file. Defaults to False.
                 - filename (str, optional): Filename to save code to. Required if save_to_file is True.
                 - working_dir (str, optional): Working directory. Defaults to self.working_dir.
+                  Code needing a directory other than the current one always runs in a worker process.
                 - timeout (int, optional): Timeout in seconds. Defaults to 30.
                 - use_subprocess (bool, optional): Whether to use subprocess. Defaults to False.
+                - durable (bool, optional): Whether to fsync the saved file before returning. Defaults to False.
             
         Returns:
             Dict[str, Any]: Execution result
@@ -65,6 +787,7 @@ class PythonExecutorTool(Tool):
         working_dir = params.get("working_dir", self.working_dir)
         timeout = params.get("timeout", 30)
         use_subprocess = params.get("use_subprocess", False)
+        durable = params.get("durable", False)
         
         if not code:
             result = {
@@ -97,9 +820,22 @@ class PythonExecutorTool(Tool):
             
             file_path = os.path.join(working_dir, filename)
             
+            # Write next to the target and rename over it, so readers never see a partial file
+            temp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            
             try:
-                with open(file_path, "w") as f:
-                    f.write(code)
+                try:
+                    with open(temp_path, "w") as f:
+                        f.write(code)
+                        if durable:
+                            f.flush()
+                            os.fsync(f.fileno())
+                    
+                    os.replace(temp_path, file_path)
+                except BaseException:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
                 
                 logger.info(f"Saved Python code to {file_path}")
                 
@@ -125,61 +861,86 @@ class PythonExecutorTool(Tool):
                 self._set_status("idle")
                 return result
         
+        # The working directory is process-wide, so code that needs a different one runs
+        # in a worker process rather than changing it under every other thread
+        needs_own_cwd = bool(working_dir) and os.path.realpath(working_dir) != os.path.realpath(os.getcwd())
+        
         # Execute code
-        if use_subprocess:
-            # Use CLI tool to execute Python script
-            from autobot.tools.cli import CLITool
-            
-            cli_tool = CLITool(working_dir=working_dir)
+        if use_subprocess or needs_own_cwd:
+            # Run in a pooled worker process
+            try:
+                run = self._get_pool().submit(
+                    code,
+                    timeout,
+                    working_dir=working_dir,
+                    filename=file_path if save_to_file else SNIPPET_FILENAME
+                )
+                
+                stdout = run["stdout"].decode(errors="replace")
+                stderr = run["stderr"].decode(errors="replace")
+                
+                if use_subprocess:
+                    result = {
+                        "status": "success" if run["exit_code"] == 0 else "error",
+                        "exit_code": run["exit_code"],
+                        "stdout": stdout,
+                        "stderr": stderr
+                    }
+                    
+                    if run["exit_code"] != 0:
+                        result["error"] = f"Script failed with exit code {run['exit_code']}: {stderr}"
+                
+                elif run["exit_code"] == 0:
+                    # Report in the same format as an in-process run
+                    result = {
+                        "status": "success",
+                        "output": stdout
+                    }
+                    
+                    if stderr:
+                        result["stderr"] = stderr
+                
+                else:
+                    # The last traceback line carries the exception message
+                    lines = stderr.strip().splitlines()
+                    result = {
+                        "status": "error",
+                        "error": lines[-1] if lines else f"Exited with code {run['exit_code']}",
+                        "traceback": stderr
+                    }
+                
+            except Exception as e:
+                result = {
+                    "status": "error",
+                    "error": str(e)
+                }
             
             if save_to_file:
-                # Execute saved file
-                result = cli_tool.execute({
-                    "command": f"python {filename}",
-                    "timeout": timeout,
-                    "working_dir": working_dir
-                })
-            else:
-                # Save to temporary file and execute
-                with tempfile.NamedTemporaryFile(suffix=".py", mode="w", delete=False) as temp_file:
-                    temp_file.write(code)
-                    temp_path = temp_file.name
-                
-                try:
-                    result = cli_tool.execute({
-                        "command": f"python {temp_path}",
-                        "timeout": timeout,
-                        "working_dir": working_dir
-                    })
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.remove(temp_path)
-                    except:
-                        pass
+                result["filename"] = filename
+                result["path"] = file_path
             
             self._set_result(result)
             self._set_status("idle")
             return result
             
         else:
-            # Execute in current process
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            old_cwd = os.getcwd()
-            
-            redirected_output = StringIO()
-            redirected_error = StringIO()
+            # Execute in current process, capturing output only from this context
+            # so concurrent executions don't see each other's output
+            _install_stream_routers()
             
-            sys.stdout = redirected_output
-            sys.stderr = redirected_error
+            redirected_output = _ListSink()
+            redirected_error = _ListSink()
             
-            if working_dir:
-                os.chdir(working_dir)
+            stdout_token = _stdout_sink.set(redirected_output)
+            stderr_token = _stderr_sink.set(redirected_error)
             
             try:
                 # Execute code
-                exec(code, {})
+                code_obj = _compile_code(code, file_path if save_to_file else SNIPPET_FILENAME)
+                if isinstance(code_obj, SyntaxError):
+                    raise code_obj.with_traceback(None)
+                
+                exec(code_obj, {JIT_DECORATOR_NAME: _jit})
                 
                 output = redirected_output.getvalue()
                 error = redirected_error.getvalue()
@@ -220,12 +981,22 @@ class PythonExecutorTool(Tool):
                 return result
                 
             finally:
-                # Restore stdout, stderr, and cwd
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
-                
-                if working_dir:
-                    os.chdir(old_cwd)
+                # Restore stdout and stderr
+                _stdout_sink.reset(stdout_token)
+                _stderr_sink.reset(stderr_token)
+    
+    @classmethod
+    def _get_pool(cls) -> PythonWorkerPool:
+        """
+        Get the shared worker pool, starting it if needed.
+        
+        Returns:
+            PythonWorkerPool: Worker pool
+        """
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = PythonWorkerPool()
+            return cls._pool
     
     def execute_file(self, file_path: str, timeout: int = 30) -> Dict[str, Any]:
         """
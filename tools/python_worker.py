@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Python worker process for Autobot.
+Runs one code snippet sent by PythonWorkerPool, with modules imported before it arrives.
+
+The job and its result are pickled over the process's original stdin and stdout.
+Module names given as arguments are imported at startup.
+"""
+
+import os
+import sys
+import pickle
+import tempfile
+import traceback
+import importlib
+from typing import Dict, Any
+
+def _run(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one job with stdout and stderr captured at the file descriptor level.
+    
+    Args:
+        job (Dict[str, Any]): Job
+            - code (str): Python code to execute
+            - filename (str): Filename reported in tracebacks
+            - working_dir (str, optional): Working directory
+    
+    Returns:
+        Dict[str, Any]: Exit code and captured stdout and stderr bytes
+    """
+    filename = job["filename"]
+    working_dir = job.get("working_dir")
+    old_cwd = os.getcwd()
+    old_argv = sys.argv
+    exit_code = 0
+    
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        saved_stdout = os.dup(1)
+        saved_stderr = os.dup(2)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        
+        try:
+            if working_dir:
+                os.chdir(working_dir)
+            
+            # Resolve imports against the script's directory and hide the worker's own
+            # arguments, as `python script.py` would
+            sys.path[0] = os.getcwd()
+            sys.argv = [filename]
+            
+            exec(compile(job["code"], filename, "exec"), {"__name__": "__main__", "__file__": filename})
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException as e:
+            # Skip this module's frame so tracebacks start in the user's code
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_stdout, 1)
+            os.dup2(saved_stderr, 2)
+            os.close(saved_stdout)
+            os.close(saved_stderr)
+            os.chdir(old_cwd)
+            sys.argv = old_argv
+        
+        out.seek(0)
+        err.seek(0)
+        
+        return {
+            "exit_code": exit_code,
+            "stdout": out.read(),
+            "stderr": err.read()
+        }
+
+def main() -> None:
+    """Import the preloaded modules, then run a single job."""
+    # Keep the protocol pipes private; user code sees an empty stdin and captured output
+    jobs = os.fdopen(os.dup(0), "rb")
+    results = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    
+    for module in sys.argv[1:]:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+    
+    try:
+        job = pickle.load(jobs)
+    except EOFError:
+        return
+    
+    pickle.dump(_run(job), results)
+    results.flush()
+
+if __name__ == "__main__":
+    main()
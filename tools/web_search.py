@@ -5,28 +5,358 @@ Performs web searches and fetches web content.
 """
 
 import os
+import re
+import time
 import logging
 import json
+import socket
+import html.parser
+import ipaddress
+import threading
 import requests
-from typing import Dict, Any, List, Optional
-from urllib.parse import urlparse, quote_plus
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlparse, urljoin, quote_plus
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 from autobot.tools.base import Tool
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# User agent sent with every request to avoid being blocked
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Google Custom Search API endpoint
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+
+# Maximum concurrent requests for fetch_many; also the per-host connection pool size
+FETCH_MAX_WORKERS = 20
+
+# Maximum number of redirects followed by a fetch, each checked like the original URL
+MAX_REDIRECTS = 5
+
+# Default cap on how much of a response body is downloaded
+DEFAULT_MAX_BYTES = 2_000_000
+
+# Chunk size for streaming response bodies
+FETCH_CHUNK_SIZE = 65536
+
+# Maximum number of fetch results kept for conditional revalidation
+FETCH_CACHE_SIZE = 128
+
+# Default seconds a successful search result is reused for an identical query
+SEARCH_CACHE_TTL = 300
+
+# Maximum number of search results kept for reuse
+SEARCH_CACHE_SIZE = 512
+
+# Elements whose content is never visible page text
+STRIP_TAGS = ("script", "style", "noscript", "iframe", "svg")
+
+# Whitespace run containing a line break, collapsed to a single newline
+_WS_RE = re.compile(r"\s*[\r\n]\s*")
+
+# XML declaration, which lxml rejects in already-decoded documents
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+# Charset declared in an HTML <meta> tag
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+class _TextExtractor(html.parser.HTMLParser):
+    """Single-pass HTML parser collecting the title and visible text without building a tree."""
+    
+    def __init__(self):
+        """Initialize an empty extractor."""
+        super().__init__(convert_charrefs=True)
+    
+    def reset(self) -> None:
+        """Clear all state so the extractor can parse another document."""
+        super().reset()
+        self.title_parts: List[str] = []
+        self.text_parts: List[str] = []
+        self._in_title = False
+        self._skip_depth = 0
+    
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        """Enter skipped elements and the title."""
+        if tag in STRIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+    
+    def handle_endtag(self, tag: str) -> None:
+        """Leave skipped elements and the title."""
+        if tag in STRIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == "title":
+            self._in_title = False
+    
+    def handle_data(self, data: str) -> None:
+        """Collect text outside skipped elements."""
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self.title_parts.append(data)
+        self.text_parts.append(data)
+
+def _loads_json(content: bytes) -> Any:
+    """
+    Decode a JSON response body, using orjson when installed.
+    
+    Args:
+        content (bytes): Raw response body
+        
+    Returns:
+        Any: Decoded JSON
+        
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON (orjson's error is a subclass)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _copy_search_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a search result deep enough that callers cannot modify a shared one.
+    
+    Args:
+        result (Dict[str, Any]): Search result
+        
+    Returns:
+        Dict[str, Any]: Copy with its own results list and result dicts
+    """
+    return dict(result, results=[dict(item) for item in result.get("results", ())])
+
+def _is_public_host(host: str) -> bool:
+    """
+    Check whether every address a host name resolves to is publicly routable.
+    
+    Args:
+        host (str): Host name or IP address
+        
+    Returns:
+        bool: Whether the host only resolves to global addresses
+        
+    Raises:
+        socket.gaierror: If the host can't be resolved
+    """
+    addresses = {info[4][0] for info in socket.getaddrinfo(host, None)}
+    
+    # Drop IPv6 zone indices (fe80::1%eth0) before parsing
+    return all(ipaddress.ip_address(address.split("%", 1)[0]).is_global for address in addresses)
+
+def _check_peer(connection: HTTPConnection, sock: socket.socket) -> None:
+    """
+    Refuse a freshly opened connection whose peer is not a public address.
+    
+    Args:
+        connection (HTTPConnection): Connection the socket belongs to
+        sock (socket.socket): Connected socket
+        
+    Raises:
+        NewConnectionError: If the peer address is not globally routable
+    """
+    address = sock.getpeername()[0]
+    
+    if not ipaddress.ip_address(address.split("%", 1)[0]).is_global:
+        sock.close()
+        raise NewConnectionError(connection, f"Refusing connection to non-public address {address} for {connection.host}")
+
+class _PublicHTTPConnection(HTTPConnection):
+    """HTTP connection that only talks to public addresses, whatever the name resolved to earlier."""
+    
+    def _new_conn(self) -> socket.socket:
+        sock = super()._new_conn()
+        _check_peer(self, sock)
+        return sock
+
+class _PublicHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that only talks to public addresses, whatever the name resolved to earlier."""
+    
+    def _new_conn(self) -> socket.socket:
+        sock = super()._new_conn()
+        _check_peer(self, sock)
+        return sock
+
+class _PublicHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _PublicHTTPConnection
+
+class _PublicHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _PublicHTTPSConnection
+
+class _PublicOnlyAdapter(HTTPAdapter):
+    """
+    Adapter checking the address each connection actually reaches.
+    
+    _check_host resolves a name before the request, and the connection resolves it
+    again, so a DNS-rebinding host could pass the first check with a public address
+    and then be reached on a private one. Proxied requests are left to the proxy.
+    """
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _PublicHTTPConnectionPool,
+            "https": _PublicHTTPSConnectionPool
+        }
+
+# Per-thread extractor, reused across documents instead of being rebuilt for each
+_extractor_local = threading.local()
+
+def _get_extractor() -> _TextExtractor:
+    """
+    Get this thread's text extractor, creating it on first use.
+    
+    Returns:
+        _TextExtractor: Extractor ready for a new document
+    """
+    extractor = getattr(_extractor_local, "extractor", None)
+    if extractor is None:
+        extractor = _extractor_local.extractor = _TextExtractor()
+    return extractor
+
+def _decode_html(content: bytes, encoding: Optional[str]) -> str:
+    """
+    Decode an HTML document with its declared charset.
+    
+    Args:
+        content (bytes): Raw HTML
+        encoding (str, optional): Charset declared in the Content-Type header; if missing
+            or unknown, the <meta> charset is used, else UTF-8
+        
+    Returns:
+        str: Decoded document
+    """
+    if not encoding:
+        match = _META_CHARSET_RE.search(content, 0, 2048)
+        encoding = match.group(1).decode("ascii") if match else "utf-8"
+    
+    try:
+        return content.decode(encoding, errors="replace")
+    except LookupError:
+        if encoding != "utf-8":
+            return _decode_html(content, None)
+        return content.decode("utf-8", errors="replace")
+
+def _parse_html(content: bytes, extract_text: bool, encoding: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    Extract the title and, optionally, the visible text from an HTML document.
+    
+    Uses selectolax when installed, otherwise lxml or, failing that, a single-pass
+    html.parser extractor. A charset declared by the server takes precedence, as
+    in a browser; without one the document's <meta> charset is used.
+    
+    Args:
+        content (bytes): Raw HTML
+        extract_text (bool): Whether to extract text content
+        encoding (str, optional): Charset declared in the Content-Type header. Defaults to None.
+        
+    Returns:
+        Tuple[str, Optional[str]]: Title, and text content (None if not extracted)
+    """
+    text = None
+    
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(_decode_html(content, encoding))
+        
+        title_node = tree.css_first("title")
+        title = title_node.text() if title_node else ""
+        
+        if extract_text:
+            # Remove non-visible elements
+            tree.strip_tags(list(STRIP_TAGS))
+            
+            root = tree.body or tree.root
+            text = root.text(separator="\n", strip=True) if root else ""
+    elif LXML_AVAILABLE:
+        # lxml refuses to parse an empty document
+        if not content.strip():
+            return "", "" if extract_text else None
+        
+        if encoding:
+            # Decode ourselves so the header charset wins over the document's own declaration
+            tree = lxml.html.document_fromstring(_XML_DECL_RE.sub("", _decode_html(content, encoding), count=1))
+        else:
+            tree = lxml.html.document_fromstring(content)
+        
+        title = tree.findtext(".//title") or ""
+        
+        if extract_text:
+            # Remove non-visible elements, keeping the text that follows them
+            etree.strip_elements(tree, *STRIP_TAGS, with_tail=False)
+            
+            text = "\n".join(tree.itertext())
+    else:
+        document = _decode_html(content, encoding)
+        
+        extractor = _get_extractor()
+        try:
+            for start in range(0, len(document), FETCH_CHUNK_SIZE):
+                extractor.feed(document[start:start + FETCH_CHUNK_SIZE])
+            extractor.close()
+            
+            title = "".join(extractor.title_parts).strip()
+            
+            if extract_text:
+                text = "\n".join(part.strip() for part in extractor.text_parts if not part.isspace())
+        finally:
+            # Drop this document's text so the idle extractor doesn't hold on to it
+            extractor.reset()
+    
+    if text is not None:
+        # Clean up text (remove excessive newlines)
+        text = _WS_RE.sub("\n", text).strip()
+    
+    return title, text
+
 class WebSearchTool(Tool):
     """Tool for web search and content fetching."""
     
-    def __init__(self, api_key: str = None, search_engine_id: str = None):
+    def __init__(self, api_key: str = None, search_engine_id: str = None,
+                 blocked_domains: List[str] = None, allow_private_hosts: bool = False,
+                 search_cache_ttl: float = SEARCH_CACHE_TTL):
         """
         Initialize the web search tool.
         
         Args:
             api_key (str, optional): Google Custom Search API key. Defaults to None.
             search_engine_id (str, optional): Google Custom Search Engine ID. Defaults to None.
+            blocked_domains (List[str], optional): Domains (and their subdomains) or TLDs that may
+                not be fetched. Defaults to None.
+            allow_private_hosts (bool, optional): Whether URLs resolving to private, loopback or
+                other non-public addresses may be fetched. Defaults to False.
+            search_cache_ttl (float, optional): Seconds a search result is reused for an identical
+                query; 0 disables reuse. Defaults to SEARCH_CACHE_TTL.
         """
         super().__init__(
             name="web_search",
@@ -43,6 +373,38 @@ class WebSearchTool(Tool):
         if not self.google_search_available:
             logger.warning("Google Custom Search API credentials not found. Using fallback search method.")
         
+        # Query parameters shared by every Google search
+        self._google_params = {
+            "key": self.api_key,
+            "cx": self.search_engine_id
+        }
+        
+        # Shared session so repeated requests to a host reuse its keep-alive connection
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = USER_AGENT
+        adapter_class = HTTPAdapter if allow_private_hosts else _PublicOnlyAdapter
+        adapter = adapter_class(
+            pool_connections=10,
+            pool_maxsize=FETCH_MAX_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # Recent search results as (expiry, result) and searches in progress, keyed by engine, query and count
+        self._search_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._search_inflight: Dict[Tuple, Future] = {}
+        self._search_lock = threading.Lock()
+        self.search_cache_ttl = search_cache_ttl
+        
+        # Hosts rejected before any connection is made
+        self.blocked_domains = frozenset(domain.lower().strip(".") for domain in blocked_domains or [])
+        self.allow_private_hosts = allow_private_hosts
+        
+        # Fetch results of responses carrying validators, keyed by URL and fetch options (LRU order)
+        self._fetch_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._fetch_cache_lock = threading.Lock()
+        
         logger.info(f"Web Search Tool initialized")
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -51,7 +413,7 @@ class WebSearchTool(Tool):
         
         Args:
             params (Dict[str, Any]): Operation parameters
-                - operation (str): Operation to perform (search, fetch)
+                - operation (str): Operation to perform (search, fetch, fetch_many)
                 - Additional parameters specific to each operation
             
         Returns:
@@ -77,6 +439,8 @@ class WebSearchTool(Tool):
                 result = self._search(params)
             elif operation == "fetch":
                 result = self._fetch_url(params)
+            elif operation == "fetch_many":
+                result = self._fetch_many(params)
             else:
                 result = {
                     "status": "error",
@@ -108,6 +472,9 @@ class WebSearchTool(Tool):
             
         Returns:
             Dict[str, Any]: Search result
+        
+        Identical searches running at the same time share one request, and
+        successful results are reused for search_cache_ttl seconds.
         """
         query = params.get("query")
         num_results = params.get("num_results", 5)
@@ -118,12 +485,56 @@ class WebSearchTool(Tool):
                 "error": "No query provided"
             }
         
-        # Use Google Custom Search API if available
-        if self.google_search_available:
-            return self._google_search(query, num_results)
+        engine = "google" if self.google_search_available else "fallback"
+        key = (engine, query, num_results)
+        
+        # Reuse a recent result, or join an identical search already in progress
+        with self._search_lock:
+            cached = self._search_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return _copy_search_result(cached[1])
+            
+            future = self._search_inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._search_inflight[key] = future
+        
+        if not owner:
+            return _copy_search_result(future.result())
         
-        # Fallback to a basic search
-        return self._fallback_search(query, num_results)
+        result = None
+        cache_key = key
+        try:
+            # Use Google Custom Search API if available
+            if self.google_search_available:
+                try:
+                    result = self._google_search(query, num_results)
+                except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+                    logger.error(f"Google Custom Search API request failed: {str(e)}")
+                    # Fall back to basic search, cached as such so Google is retried next time
+                    result = self._fallback_search(query, num_results)
+                    cache_key = ("fallback", query, num_results)
+            else:
+                # Fallback to a basic search
+                result = self._fallback_search(query, num_results)
+            
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._search_lock:
+                del self._search_inflight[key]
+                
+                if result is not None and result["status"] == "success" and self.search_cache_ttl > 0:
+                    expiry = time.monotonic() + self.search_cache_ttl
+                    self._search_cache[cache_key] = (expiry, _copy_search_result(result))
+                    self._search_cache.move_to_end(cache_key)
+                    
+                    while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                        self._search_cache.popitem(last=False)
     
     def _google_search(self, query: str, num_results: int) -> Dict[str, Any]:
         """
@@ -135,51 +546,46 @@ class WebSearchTool(Tool):
             
         Returns:
             Dict[str, Any]: Search result
+            
+        Raises:
+            requests.exceptions.RequestException: If the API request fails
+            json.JSONDecodeError: If the API response is not valid JSON
         """
-        url = "https://www.googleapis.com/customsearch/v1"
-        
         params = {
-            "key": self.api_key,
-            "cx": self.search_engine_id,
+            **self._google_params,
             "q": query,
             "num": min(num_results, 10)  # API limit is 10 results per request
         }
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if "items" not in data:
-                return {
-                    "status": "success",
-                    "message": "No results found",
-                    "query": query,
-                    "results": []
-                }
-            
-            results = []
-            
-            for item in data["items"]:
-                results.append({
-                    "title": item.get("title", ""),
-                    "link": item.get("link", ""),
-                    "snippet": item.get("snippet", ""),
-                    "source": "Google Custom Search API"
-                })
-            
+        response = self._session.get(GOOGLE_SEARCH_URL, params=params)
+        response.raise_for_status()
+        
+        data = _loads_json(response.content)
+        
+        if "items" not in data:
             return {
                 "status": "success",
+                "message": "No results found",
                 "query": query,
-                "results": results,
-                "result_count": len(results)
+                "results": []
             }
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Google Custom Search API request failed: {str(e)}")
-            # Fall back to basic search
-            return self._fallback_search(query, num_results)
+        
+        results = []
+        
+        for item in data["items"]:
+            results.append({
+                "title": item.get("title", ""),
+                "link": item.get("link", ""),
+                "snippet": item.get("snippet", ""),
+                "source": "Google Custom Search API"
+            })
+        
+        return {
+            "status": "success",
+            "query": query,
+            "results": results,
+            "result_count": len(results)
+        }
     
     def _fallback_search(self, query: str, num_results: int) -> Dict[str, Any]:
         """
@@ -196,10 +602,10 @@ class WebSearchTool(Tool):
         url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json"
         
         try:
-            response = requests.get(url)
+            response = self._session.get(url)
             response.raise_for_status()
             
-            data = response.json()
+            data = _loads_json(response.content)
             
             results = []
             
@@ -263,6 +669,8 @@ class WebSearchTool(Tool):
                 - url (str): URL to fetch
                 - extract_text (bool, optional): Whether to extract text content. Defaults to True.
                 - include_html (bool, optional): Whether to include HTML content. Defaults to False.
+                - max_bytes (int, optional): Maximum body size to download; larger bodies are
+                  truncated. Defaults to DEFAULT_MAX_BYTES.
             
         Returns:
             Dict[str, Any]: Fetch result
@@ -270,6 +678,7 @@ class WebSearchTool(Tool):
         url = params.get("url")
         extract_text = params.get("extract_text", True)
         include_html = params.get("include_html", False)
+        max_bytes = params.get("max_bytes", DEFAULT_MAX_BYTES)
         
         if not url:
             return {
@@ -279,60 +688,95 @@ class WebSearchTool(Tool):
         
         # Validate URL
         parsed_url = urlparse(url)
-        if not parsed_url.scheme or not parsed_url.netloc:
+        if parsed_url.scheme not in ("http", "https") or not parsed_url.hostname:
             return {
                 "status": "error",
                 "error": f"Invalid URL: {url}"
             }
         
-        try:
-            # Set a user agent to avoid being blocked
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            result = {
-                "status": "success",
-                "url": url,
-                "title": "",
-                "content_type": response.headers.get("Content-Type", "")
+        # Reject disallowed hosts before spending time on a connection
+        host_error = self._check_host(parsed_url.hostname)
+        if host_error:
+            return {
+                "status": "error",
+                "error": host_error,
+                "url": url
             }
+        
+        cache_key = (url, extract_text, include_html, max_bytes)
+        with self._fetch_cache_lock:
+            cached = self._fetch_cache.get(cache_key)
+        
+        # Ask the server to skip the body if the cached copy is still current
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+        
+        try:
+            with self._get_checked(url, headers) as response:
+                if cached and response.status_code == 304:
+                    with self._fetch_cache_lock:
+                        if cache_key in self._fetch_cache:
+                            self._fetch_cache.move_to_end(cache_key)
+                    return dict(cached["result"], cached=True)
+                
+                response.raise_for_status()
+                
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                
+                result = {
+                    "status": "success",
+                    "url": url,
+                    "title": "",
+                    "content_type": response.headers.get("Content-Type", "")
+                }
+                
+                # Check if content is HTML
+                content_type = response.headers.get("Content-Type", "").lower()
+                is_html = "text/html" in content_type
+                
+                # Nothing to extract from a non-HTML body unless text was requested
+                if not is_html and not extract_text:
+                    self._cache_fetch(cache_key, etag, last_modified, result)
+                    return result
+                
+                # Read the body in chunks, stopping once max_bytes is reached
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > max_bytes:
+                        del body[max_bytes:]
+                        result["truncated"] = True
+                        break
+                
+                body = bytes(body)
+                encoding = response.encoding or "utf-8"
+                
+                # requests assumes ISO-8859-1 for text/* without a charset; let the parser sniff instead
+                declared_encoding = response.encoding if "charset=" in content_type else None
             
-            # Check if content is HTML
-            content_type = response.headers.get("Content-Type", "").lower()
-            if "text/html" in content_type:
-                soup = BeautifulSoup(response.text, "html.parser")
+            if is_html:
+                title, text = _parse_html(body, extract_text, declared_encoding)
                 
-                # Extract title
-                title_tag = soup.find("title")
-                result["title"] = title_tag.text if title_tag else ""
+                result["title"] = title
                 
                 # Extract text content if requested
                 if extract_text:
-                    # Remove script and style elements
-                    for script in soup(["script", "style"]):
-                        script.extract()
-                    
-                    # Get text
-                    text = soup.get_text(separator="\n", strip=True)
-                    
-                    # Clean up text (remove excessive newlines)
-                    lines = [line.strip() for line in text.splitlines() if line.strip()]
-                    text = "\n".join(lines)
-                    
                     result["text_content"] = text
                 
                 # Include HTML if requested
                 if include_html:
-                    result["html_content"] = response.text
+                    result["html_content"] = body.decode(encoding, errors="replace")
                 
             else:
                 # For non-HTML content, just include the raw text
-                result["text_content"] = response.text
+                result["text_content"] = body.decode(encoding, errors="replace")
             
+            self._cache_fetch(cache_key, etag, last_modified, result)
             return result
             
         except requests.exceptions.RequestException as e:
@@ -341,3 +785,148 @@ class WebSearchTool(Tool):
                 "error": f"Failed to fetch URL: {str(e)}",
                 "url": url
             }
+    
+    def _get_checked(self, url: str, headers: Dict[str, str]) -> requests.Response:
+        """
+        GET a URL, following redirects only to hosts that pass _check_host.
+        
+        Redirects are followed here rather than by requests so that a public URL
+        can't redirect the fetch to a blocked or private address.
+        
+        Args:
+            url (str): URL to fetch, already checked
+            headers (Dict[str, str]): Extra request headers
+            
+        Returns:
+            requests.Response: Streamed response that is not a redirect
+            
+        Raises:
+            requests.exceptions.InvalidURL: If a redirect points to a disallowed URL
+            requests.exceptions.TooManyRedirects: If more than MAX_REDIRECTS redirects are followed
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._session.get(url, headers=headers, stream=True, timeout=10, allow_redirects=False)
+            if not response.is_redirect:
+                return response
+            
+            url = urljoin(url, response.headers["Location"])
+            response.close()
+            
+            parsed_url = urlparse(url)
+            if parsed_url.scheme not in ("http", "https") or not parsed_url.hostname:
+                raise requests.exceptions.InvalidURL(f"Invalid redirect URL: {url}")
+            
+            host_error = self._check_host(parsed_url.hostname)
+            if host_error:
+                raise requests.exceptions.InvalidURL(f"Redirect rejected: {host_error}")
+        
+        raise requests.exceptions.TooManyRedirects(f"Exceeded {MAX_REDIRECTS} redirects")
+    
+    def _check_host(self, host: str) -> Optional[str]:
+        """
+        Check whether a host may be fetched.
+        
+        Args:
+            host (str): Host name from the URL
+            
+        Returns:
+            Optional[str]: Error message if the host is rejected, None otherwise
+        """
+        host = host.lower().rstrip(".")
+        
+        # Match the host itself and every parent domain, down to the TLD
+        labels = host.split(".")
+        for i in range(len(labels)):
+            if ".".join(labels[i:]) in self.blocked_domains:
+                return f"Blocked host: {host}"
+        
+        if self.allow_private_hosts:
+            return None
+        
+        try:
+            if not _is_public_host(host):
+                return f"Host resolves to a non-public address: {host}"
+        except (socket.gaierror, UnicodeError) as e:
+            return f"Could not resolve host {host}: {str(e)}"
+        
+        return None
+    
+    def _cache_fetch(self, cache_key: Tuple, etag: Optional[str], last_modified: Optional[str], result: Dict[str, Any]) -> None:
+        """
+        Remember a fetch result for conditional revalidation and evict the least recently used ones.
+        
+        Results without an ETag or Last-Modified header can't be revalidated and are not stored.
+        
+        Args:
+            cache_key (Tuple): URL and fetch options
+            etag (str, optional): ETag response header
+            last_modified (str, optional): Last-Modified response header
+            result (Dict[str, Any]): Fetch result
+        """
+        if not etag and not last_modified:
+            return
+        
+        with self._fetch_cache_lock:
+            self._fetch_cache[cache_key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "result": dict(result)
+            }
+            self._fetch_cache.move_to_end(cache_key)
+            
+            while len(self._fetch_cache) > FETCH_CACHE_SIZE:
+                self._fetch_cache.popitem(last=False)
+    
+    def _fetch_many(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch content from several URLs concurrently.
+        
+        Requests run on a thread pool sharing the tool's session, so network
+        round trips overlap instead of adding up.
+        
+        Args:
+            params (Dict[str, Any]): Fetch parameters
+                - urls (List[str]): URLs to fetch
+                - extract_text (bool, optional): Whether to extract text content. Defaults to True.
+                - include_html (bool, optional): Whether to include HTML content. Defaults to False.
+                - max_bytes (int, optional): Maximum body size to download per URL. Defaults to DEFAULT_MAX_BYTES.
+            
+        Returns:
+            Dict[str, Any]: Fetch result
+                - results (List[Dict[str, Any]]): Result for each URL, in the same order as urls
+        """
+        urls = params.get("urls")
+        
+        if not urls:
+            return {
+                "status": "error",
+                "error": "No URLs provided"
+            }
+        
+        fetch_params = [
+            {
+                "url": url,
+                "extract_text": params.get("extract_text", True),
+                "include_html": params.get("include_html", False),
+                "max_bytes": params.get("max_bytes", DEFAULT_MAX_BYTES)
+            }
+            for url in urls
+        ]
+        
+        max_workers = min(len(urls), FETCH_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._fetch_url, fetch_params))
+        
+        failed = sum(1 for result in results if result["status"] != "success")
+        
+        result = {
+            "status": "success" if failed < len(results) else "error",
+            "results": results,
+            "result_count": len(results),
+            "failed_count": failed
+        }
+        
+        if failed == len(results):
+            result["error"] = "Failed to fetch all URLs"
+        
+        return result